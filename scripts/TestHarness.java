@@ -0,0 +1,239 @@
+import java.io.BufferedInputStream;
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.File;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.PrintStream;
+import java.lang.reflect.InvocationTargetException;
+import java.net.URL;
+import java.net.URLClassLoader;
+import java.security.Permission;
+
+/**
+ * scripts/TestHarness.java
+ * 제출 코드를 하나의 JVM 안에서 테스트케이스마다 반복 실행하는 하네스입니다.
+ * (multi_test_runner.py에서 사용하며, 테스트마다 JVM을 새로 띄우는 비용을 없앱니다.)
+ *
+ * 실행: java -cp <하네스 디렉토리> TestHarness <제출 클래스 디렉토리> <클래스 이름> <요청 파일> <응답 파일>
+ *       요청/응답은 표준 입출력이 아닌 별도 파일(예: /dev/fd/3, /dev/fd/4)로 주고받아, 제출 코드가
+ *       FileDescriptor.in/out 등으로 fd 0/1에 직접 접근해도 프로토콜이 깨지지 않게 합니다.
+ * 요청: "<입력 바이트 수> <제한 시간(ms), 0이면 무제한>\n<입력>"
+ * 응답: "OK <출력 바이트 수>\n<표준 출력>" 또는 "ERR <바이트 수>\n<표준 에러>"
+ *       제한 시간 안에 main이 끝나지 않으면 "TIMEOUT 0\n", main은 끝났지만 제출 코드가 만든
+ *       스레드가 남아 있으면 "RETRY 0\n"을 보내고 하네스를 종료합니다. (둘 다 테스트마다 JVM을 실행하는 방식으로 다시 실행)
+ *
+ * 테스트마다 새 클래스 로더로 제출 클래스를 읽어 static 필드가 이전 실행 값을 갖지 않도록 하고,
+ * System.exit 호출은 SecurityManager로 가로채 하네스가 종료되지 않도록 합니다.
+ * main은 테스트마다 새 ThreadGroup의 스레드에서 실행하고, 제출 코드가 만든 non-daemon 스레드
+ * (예: new Thread(null, new Main(), "", 1 << 26).start())가 끝날 때까지 기다린 뒤 응답합니다.
+ */
+public class TestHarness {
+
+    /** 제출 코드의 System.exit 호출을 예외로 바꾸어 전달합니다. */
+    static class ExitTrappedException extends SecurityException {
+        final int status;
+
+        ExitTrappedException(int status) {
+            super("System.exit(" + status + ")");
+            this.status = status;
+        }
+    }
+
+    /** 한 번의 실행에서 제출 코드가 만든 스레드를 묶고, 처리되지 않은 첫 예외를 기록합니다. */
+    static class RunGroup extends ThreadGroup {
+        volatile Throwable failure;
+        volatile String failedThread;
+
+        RunGroup() {
+            super("submission");
+        }
+
+        @Override
+        public synchronized void uncaughtException(Thread thread, Throwable e) {
+            if (failure == null) {
+                failure = e;
+                failedThread = thread.getName();
+            }
+        }
+    }
+
+    /** 하네스가 스스로 종료할 때는 checkExit에서 막지 않습니다. */
+    private static volatile boolean halting = false;
+
+    public static void main(String[] args) throws Exception {
+        URL[] classPath = { new File(args[0]).toURI().toURL() };
+        String className = args[1];
+
+        InputStream requests = new BufferedInputStream(new FileInputStream(args[2]));
+        PrintStream responses = new PrintStream(new FileOutputStream(args[3]), false, "UTF-8");
+        PrintStream originalOut = System.out;
+        PrintStream originalErr = System.err;
+
+        try {
+            System.setSecurityManager(new SecurityManager() {
+                @Override
+                public void checkExit(int status) {
+                    if (!halting) {
+                        throw new ExitTrappedException(status);
+                    }
+                }
+
+                @Override
+                public void checkPermission(Permission perm) {
+                    // System.exit 외의 권한 검사는 모두 허용합니다.
+                }
+            });
+        } catch (UnsupportedOperationException e) {
+            // SecurityManager를 지원하지 않는 JDK(18+)에서는 System.exit가 하네스를 종료시키며,
+            // 이 경우 multi_test_runner.py가 테스트마다 JVM을 실행하는 방식으로 대체합니다.
+        }
+
+        String header;
+        while ((header = readLine(requests)) != null) {
+            String[] fields = header.trim().split(" ");
+            byte[] input = readFully(requests, Integer.parseInt(fields[0]));
+            long timeoutMillis = fields.length > 1 ? Long.parseLong(fields[1]) : 0;
+            long deadline = timeoutMillis > 0 ? System.nanoTime() + timeoutMillis * 1_000_000L : Long.MAX_VALUE;
+
+            ByteArrayOutputStream out = new ByteArrayOutputStream();
+            ByteArrayOutputStream err = new ByteArrayOutputStream();
+            PrintStream outStream = new PrintStream(out, false, "UTF-8");
+            PrintStream errStream = new PrintStream(err, true, "UTF-8");
+            System.setIn(new ByteArrayInputStream(input));
+            System.setOut(outStream);
+            System.setErr(errStream);
+
+            RunGroup group = new RunGroup();
+            String unfinished = null;
+            try (URLClassLoader loader = new URLClassLoader(classPath, ClassLoader.getPlatformClassLoader())) {
+                Thread runner = new Thread(group, () -> {
+                    try {
+                        Class.forName(className, true, loader)
+                                .getMethod("main", String[].class)
+                                .invoke(null, (Object) new String[0]);
+                    } catch (InvocationTargetException e) {
+                        group.uncaughtException(Thread.currentThread(), e.getCause());
+                    } catch (ReflectiveOperationException e) {
+                        group.uncaughtException(Thread.currentThread(), e);
+                    }
+                }, "main");
+                runner.setContextClassLoader(loader);
+                runner.start();
+
+                if (!await(runner, deadline)) {
+                    unfinished = "TIMEOUT";
+                } else if (!awaitNonDaemonThreads(group, deadline)) {
+                    unfinished = "RETRY";
+                }
+            }
+
+            if (unfinished != null) {
+                // 남은 스레드가 이후 테스트의 출력에 섞이지 않도록 응답 후 하네스를 바로 종료합니다.
+                responses.print(unfinished + " 0\n");
+                responses.flush();
+                halting = true;
+                Runtime.getRuntime().halt(0);
+            }
+
+            boolean ok = true;
+            Throwable failure = group.failure;
+            if (failure != null) {
+                ExitTrappedException exit = findExit(failure);
+                if (exit != null) {
+                    ok = exit.status == 0;
+                    if (!ok) {
+                        errStream.println("System.exit(" + exit.status + ")");
+                    }
+                } else {
+                    ok = false;
+                    errStream.print("Exception in thread \"" + group.failedThread + "\" ");
+                    failure.printStackTrace(errStream);
+                }
+            }
+            try {
+                // 끝난 실행의 스레드 그룹이 상위 그룹에 계속 쌓이지 않도록 정리합니다. (남은 daemon 스레드가 있으면 그대로 둠)
+                group.destroy();
+            } catch (IllegalThreadStateException e) {
+                // 아직 살아 있는 daemon 스레드가 있습니다.
+            }
+            outStream.flush();
+            System.setIn(new ByteArrayInputStream(new byte[0]));
+            System.setOut(originalOut);
+            System.setErr(originalErr);
+
+            byte[] body = ok ? out.toByteArray() : err.toByteArray();
+            responses.print((ok ? "OK " : "ERR ") + body.length + "\n");
+            responses.write(body);
+            responses.flush();
+        }
+    }
+
+    /** deadline(System.nanoTime 기준)까지 스레드가 끝나기를 기다립니다. 끝났으면 true를 반환합니다. */
+    private static boolean await(Thread thread, long deadline) throws InterruptedException {
+        if (deadline == Long.MAX_VALUE) {
+            thread.join();
+            return true;
+        }
+        long remainingMillis = (deadline - System.nanoTime()) / 1_000_000L;
+        if (remainingMillis > 0) {
+            thread.join(remainingMillis);
+        }
+        return !thread.isAlive();
+    }
+
+    /** 제출 코드가 만든 non-daemon 스레드가 모두 끝날 때까지 deadline까지 기다립니다. (기다리는 동안 새로 생긴 스레드 포함) */
+    private static boolean awaitNonDaemonThreads(ThreadGroup group, long deadline) throws InterruptedException {
+        while (true) {
+            Thread[] threads = new Thread[group.activeCount() + 8];
+            int count = group.enumerate(threads, true);
+            Thread running = null;
+            for (int i = 0; i < count && running == null; i++) {
+                if (threads[i].isAlive() && !threads[i].isDaemon()) {
+                    running = threads[i];
+                }
+            }
+            if (running == null) {
+                return true;
+            }
+            if (!await(running, deadline)) {
+                return false;
+            }
+        }
+    }
+
+    /** 예외 원인 사슬에서 System.exit 호출을 찾습니다. (static 초기화 중 호출 포함) */
+    private static ExitTrappedException findExit(Throwable e) {
+        for (Throwable t = e; t != null; t = t.getCause()) {
+            if (t instanceof ExitTrappedException) {
+                return (ExitTrappedException) t;
+            }
+        }
+        return null;
+    }
+
+    /** 줄바꿈 전까지 읽습니다. 입력이 끝났으면 null을 반환합니다. */
+    private static String readLine(InputStream in) throws IOException {
+        StringBuilder line = new StringBuilder();
+        int c;
+        while ((c = in.read()) != -1 && c != '\n') {
+            line.append((char) c);
+        }
+        return c == -1 && line.length() == 0 ? null : line.toString();
+    }
+
+    private static byte[] readFully(InputStream in, int length) throws IOException {
+        byte[] buffer = new byte[length];
+        int offset = 0;
+        while (offset < length) {
+            int read = in.read(buffer, offset, length - offset);
+            if (read == -1) {
+                throw new IOException("입력이 예상보다 일찍 끝났습니다.");
+            }
+            offset += read;
+        }
+        return buffer;
+    }
+}
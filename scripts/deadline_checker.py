@@ -12,6 +12,79 @@ import subprocess
 from datetime import datetime, timedelta
 import pytz
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from webhook_session import WEBHOOK_TIMEOUT, create_webhook_session
+
+# 웹훅 알림을 동시에 전송할 최대 개수
+NOTIFY_MAX_WORKERS = 16
+# 알림마다 새 연결을 맺지 않도록 동시에 전송하는 알림 수만큼 연결을 유지하는 세션을 재사용합니다.
+SESSION = create_webhook_session(pool_maxsize=NOTIFY_MAX_WORKERS)
+
+
+class CircuitBreaker:
+    """호스트별 연속 실패를 세어, 기준 이상 실패한 호스트로의 요청은 잠시 보내지 않습니다.
+
+    웹훅 서버가 내려가 있으면 알림마다 제한 시간과 재시도를 모두 기다리게 되므로,
+    failure_threshold번 연속 실패한 호스트는 recovery_timeout초 동안 건너뛰고
+    그 뒤에는 한 번만 시험 삼아 요청을 보냅니다. (반열림 상태)
+    """
+
+    def __init__(self, failure_threshold=3, recovery_timeout=300):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = {}
+        self._opened_at = {}
+        self._lock = threading.Lock()
+
+    def allow(self, host):
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return True
+            if time.monotonic() - opened_at >= self.recovery_timeout:
+                # 시험 요청 하나만 보내고, 결과가 나올 때까지 다른 요청은 계속 건너뜁니다.
+                self._opened_at[host] = time.monotonic()
+                return True
+            return False
+
+    def record_success(self, host):
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+
+    def record_failure(self, host):
+        with self._lock:
+            self._failures[host] = self._failures.get(host, 0) + 1
+            if self._failures[host] >= self.failure_threshold:
+                self._opened_at[host] = time.monotonic()
+
+
+WEBHOOK_BREAKER = CircuitBreaker()
+
+
+def post_webhook(webhook_url, payload):
+    """웹훅으로 payload를 전송하고 응답을 반환합니다. 호스트가 연속으로 실패 중이면 요청 없이 None을 반환합니다."""
+    host = urlsplit(webhook_url).netloc
+    if not WEBHOOK_BREAKER.allow(host):
+        return None
+
+    try:
+        response = SESSION.post(webhook_url, json=payload, timeout=WEBHOOK_TIMEOUT)
+    except requests.exceptions.RequestException:
+        WEBHOOK_BREAKER.record_failure(host)
+        raise
+
+    # 4xx는 개별 웹훅 설정 문제이므로 서버 장애로 세지 않습니다.
+    if response.status_code >= 500:
+        WEBHOOK_BREAKER.record_failure(host)
+    else:
+        WEBHOOK_BREAKER.record_success(host)
+    return response
 
 
 def get_current_week_range():
@@ -282,11 +355,38 @@ def get_weekly_problem_count(username):
     return count_api
 
 
+@lru_cache(maxsize=1)
+def load_webhook_map():
+    """MATTERMOST_WEBHOOKS_JSON 환경변수({"githubID": "webhook URL", ...})를 읽습니다. 없거나 잘못되었으면 빈 딕셔너리를 반환합니다."""
+    raw = os.getenv("MATTERMOST_WEBHOOKS_JSON")
+    if not raw:
+        return {}
+    try:
+        webhooks = json.loads(raw)
+    except ValueError as e:
+        print(f"⚠️ MATTERMOST_WEBHOOKS_JSON 파싱 실패, 개별 환경변수를 사용합니다: {e}")
+        return {}
+    if not isinstance(webhooks, dict):
+        print("⚠️ MATTERMOST_WEBHOOKS_JSON은 사용자별 URL 객체여야 합니다. 개별 환경변수를 사용합니다.")
+        return {}
+    return {str(name).lower(): url for name, url in webhooks.items() if url}
+
+
+def get_webhook_url(username):
+    """사용자의 개인 webhook URL을 반환합니다. MATTERMOST_WEBHOOKS_JSON에 없으면 {USERNAME}_MATTERMOST_URL을 사용합니다."""
+    return load_webhook_map().get(username.lower()) or os.getenv(f"{username.upper()}_MATTERMOST_URL")
+
+
+def webhook_setting_names(username):
+    """사용자의 개인 webhook을 설정할 수 있는 Secret 이름을 안내용 문자열로 반환합니다."""
+    return f'MATTERMOST_WEBHOOKS_JSON의 "{username}" 또는 {username.upper()}_MATTERMOST_URL'
+
+
 def send_personal_notification(username, message):
     """사용자별 개인 webhook으로 알림 전송"""
-    # 개인 webhook URL 패턴: {USERNAME}_MATTERMOST_URL (대문자)
-    personal_webhook_key = f"{username.upper()}_MATTERMOST_URL"
-    personal_webhook_url = os.getenv(personal_webhook_key)
+    # 개인 webhook URL 패턴: MATTERMOST_WEBHOOKS_JSON 또는 {USERNAME}_MATTERMOST_URL (대문자)
+    personal_webhook_key = webhook_setting_names(username)
+    personal_webhook_url = get_webhook_url(username)
 
     if not personal_webhook_url:
         print(f"❌ {username}의 개인 webhook이 설정되지 않음 ({personal_webhook_key})")
@@ -299,7 +399,10 @@ def send_personal_notification(username, message):
     }
 
     try:
-        response = requests.post(personal_webhook_url, json=payload)
+        response = post_webhook(personal_webhook_url, payload)
+        if response is None:
+            print(f"⏭️ {username}에게 개인 알림 건너뜀: 웹훅 서버가 연속으로 실패하고 있습니다.")
+            return False
         if response.status_code == 200:
             print(f"✅ {username}에게 개인 알림 전송 성공")
             return True
@@ -414,45 +517,51 @@ def create_personal_reminder_message(username, problem_count, reminder_type, rep
     return message
 
 
-def send_summary_notification(participants_status, reminder_type, repo_info):
-    """전체 요약 알림을 모든 참가자에게 개인 DM으로 전송"""
-    # 모든 참가자에게 개인 DM으로 요약 전송
-    success_count = 0
-    total_participants = len(participants_status)
+def post_summary_notification(username, webhook_url, payload):
+    """참가자 한 명에게 요약 알림을 전송하고 성공 여부를 반환합니다."""
+    try:
+        response = post_webhook(webhook_url, payload)
+        if response is None:
+            print(f"⏭️ {username}에게 요약 알림 건너뜀: 웹훅 서버가 연속으로 실패하고 있습니다.")
+            return False
+        if response.status_code == 200:
+            print(f"✅ {username}에게 요약 알림 전송 성공")
+            return True
+        else:
+            print(f"❌ {username}에게 요약 알림 전송 실패: {response.status_code}")
+            return False
 
-    for participant in participants_status:
-        username = participant["username"]
-        webhook_key = f"{username.upper()}_MATTERMOST_URL"
-        webhook_url = os.getenv(webhook_key)
+    except Exception as e:
+        print(f"❌ {username}에게 요약 알림 전송 예외: {e}")
+        return False
 
-        if not webhook_url:
-            print(f"⚠️ {username}의 개인 webhook이 설정되지 않음 ({webhook_key})")
-            continue
 
-        kst = pytz.timezone("Asia/Seoul")
-        now = datetime.now(kst)
-        week_start, week_end = get_current_week_range()
+def create_summary_message(participants_status, reminder_type, repo_info):
+    """전체 요약 알림 메시지를 만듭니다. 모든 참가자에게 같은 메시지를 보냅니다."""
+    kst = pytz.timezone("Asia/Seoul")
+    now = datetime.now(kst)
+    week_start, week_end = get_current_week_range()
 
-        repo_name = (
-            repo_info.get("name", "Algorithm Study") if repo_info else "Algorithm Study"
-        )
+    repo_name = (
+        repo_info.get("name", "Algorithm Study") if repo_info else "Algorithm Study"
+    )
 
-        # 통계 계산
-        total_participants = len(participants_status)
-        achieved_goal = len([p for p in participants_status if p["problem_count"] >= 5])
-        need_reminder = len([p for p in participants_status if p["problem_count"] < 5])
+    # 통계 계산
+    total_participants = len(participants_status)
+    achieved_goal = len([p for p in participants_status if p["problem_count"] >= 5])
+    need_reminder = len([p for p in participants_status if p["problem_count"] < 5])
 
-        # 알림 타입별 제목
-        if reminder_type == "friday_morning":
-            title = "📅 **주간 중간 체크 요약** (금요일 오전)"
-        elif reminder_type == "sunday_morning":
-            title = "⏰ **마감일 당일 요약** (일요일 오전)"
-        elif reminder_type == "sunday_evening":
-            title = "🚨 **마감 임박 요약** (일요일 저녁)"
-        else:
-            title = "📊 **스터디 현황 요약**"
+    # 알림 타입별 제목
+    if reminder_type == "friday_morning":
+        title = "📅 **주간 중간 체크 요약** (금요일 오전)"
+    elif reminder_type == "sunday_morning":
+        title = "⏰ **마감일 당일 요약** (일요일 오전)"
+    elif reminder_type == "sunday_evening":
+        title = "🚨 **마감 임박 요약** (일요일 저녁)"
+    else:
+        title = "📊 **스터디 현황 요약**"
 
-        message = f"""
+    message = f"""
 {title}
 
 🏠 **스터디**: {repo_name}
@@ -466,21 +575,21 @@ def send_summary_notification(participants_status, reminder_type, repo_info):
 
 """
 
-        if participants_status:
-            message += "👥 **참가자별 현황**:\n"
-            for participant in participants_status:
-                status_emoji = "✅" if participant["problem_count"] >= 5 else "⚠️"
-                message += f"- {status_emoji} **{participant['username']}**: {participant['problem_count']}문제\n"
+    if participants_status:
+        message += "👥 **참가자별 현황**:\n"
+        for participant in participants_status:
+            status_emoji = "✅" if participant["problem_count"] >= 5 else "⚠️"
+            message += f"- {status_emoji} **{participant['username']}**: {participant['problem_count']}문제\n"
 
-            message += "\n"
+        message += "\n"
 
-        if need_reminder > 0:
-            need_reminder_users = [
-                p["username"] for p in participants_status if p["problem_count"] < 5
-            ]
-            message += f"🔔 **개인 알림 발송 대상**: {', '.join(need_reminder_users)}\n\n"
+    if need_reminder > 0:
+        need_reminder_users = [
+            p["username"] for p in participants_status if p["problem_count"] < 5
+        ]
+        message += f"🔔 **개인 알림 발송 대상**: {', '.join(need_reminder_users)}\n\n"
 
-        message += f"""
+    message += f"""
 ---
 💡 **참고사항**:
 - 마감: 매주 일요일 23:59 KST
@@ -489,23 +598,37 @@ def send_summary_notification(participants_status, reminder_type, repo_info):
 
 *이 메시지는 자동으로 전송되었습니다.*
 """
+    return message
 
-        payload = {
-            "text": message,
-            "username": "Algorithm Study Bot",
-            "icon_emoji": ":chart_with_upwards_trend:",
-        }
 
-        try:
-            response = requests.post(webhook_url, json=payload)
-            if response.status_code == 200:
-                success_count += 1
-                print(f"✅ {username}에게 요약 알림 전송 성공")
-            else:
-                print(f"❌ {username}에게 요약 알림 전송 실패: {response.status_code}")
+def send_summary_notification(participants_status, reminder_type, repo_info):
+    """전체 요약 알림을 모든 참가자에게 개인 DM으로 전송"""
+    # 모든 참가자에게 개인 DM으로 요약 전송 (메시지는 한 번만 만듭니다)
+    success_count = 0
+    total_participants = len(participants_status)
+    payload = {
+        "text": create_summary_message(participants_status, reminder_type, repo_info),
+        "username": "Algorithm Study Bot",
+        "icon_emoji": ":chart_with_upwards_trend:",
+    }
+    deliveries = []
 
-        except Exception as e:
-            print(f"❌ {username}에게 요약 알림 전송 예외: {e}")
+    for participant in participants_status:
+        username = participant["username"]
+        webhook_key = webhook_setting_names(username)
+        webhook_url = get_webhook_url(username)
+
+        if not webhook_url:
+            print(f"⚠️ {username}의 개인 webhook이 설정되지 않음 ({webhook_key})")
+            continue
+
+        deliveries.append((username, webhook_url, payload))
+
+    # 참가자별 전송은 서로 독립적이므로 동시에 보냅니다.
+    if deliveries:
+        with ThreadPoolExecutor(max_workers=min(len(deliveries), NOTIFY_MAX_WORKERS)) as executor:
+            futures = [executor.submit(post_summary_notification, *delivery) for delivery in deliveries]
+            success_count = sum(future.result() for future in futures)
 
     print(f"✅ 전체 요약 알림 전송 완료: {success_count}/{total_participants}명")
     return success_count > 0
@@ -592,7 +715,6 @@ def main():
                 total_sent += 1
 
                 # 메시지 간 간격 (API 제한 방지)
-                import time
                 time.sleep(2)
 
         print(f"✅ 디버깅 모드 알림 성공: {total_success}/{total_sent}건")
@@ -621,8 +743,8 @@ def main():
         if participants_status:
             first_participant = participants_status[0]
             username = first_participant["username"]
-            webhook_key = f"{username.upper()}_MATTERMOST_URL"
-            webhook_url = os.getenv(webhook_key)
+            webhook_key = webhook_setting_names(username)
+            webhook_url = get_webhook_url(username)
 
             if webhook_url:
                 payload = {
@@ -630,24 +752,31 @@ def main():
                     "username": "Algorithm Study Debug Bot",
                     "icon_emoji": ":bug:",
                 }
-                requests.post(webhook_url, json=payload)
+                post_webhook(webhook_url, payload)
                 print(f"✅ 디버깅 모드 요약 알림 전송 완료 ({username})")
             else:
                 print(f"⚠️ 디버깅 모드 요약 전송 실패: {webhook_key} 설정되지 않음")
 
     else:
-        # 일반 모드: 기존 로직
+        # 일반 모드: 메시지를 만든 뒤 개인 알림을 동시에 전송
         success_count = 0
-        for participant in need_reminder_users:
-            username = participant["username"]
-            problem_count = participant["problem_count"]
-
-            message = create_personal_reminder_message(
-                username, problem_count, reminder_type, repo_info
+        messages = [
+            (
+                participant["username"],
+                create_personal_reminder_message(
+                    participant["username"], participant["problem_count"], reminder_type, repo_info
+                ),
             )
+            for participant in need_reminder_users
+        ]
 
-            if send_personal_notification(username, message):
-                success_count += 1
+        if messages:
+            with ThreadPoolExecutor(max_workers=min(len(messages), NOTIFY_MAX_WORKERS)) as executor:
+                futures = [
+                    executor.submit(send_personal_notification, username, message)
+                    for username, message in messages
+                ]
+                success_count = sum(future.result() for future in futures)
 
         print(f"✅ 개인 알림 성공: {success_count}/{len(need_reminder_users)}건")
 
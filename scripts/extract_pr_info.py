@@ -250,6 +250,15 @@ def remove_duplicate_problems(problems):
     return unique_problems
 
 
+def write_github_output(outputs):
+    """GitHub Actions 출력 값을 한 번에 기록합니다."""
+    if "GITHUB_OUTPUT" not in os.environ:
+        return
+    lines = "".join(f"{key}={value}\n" for key, value in outputs.items())
+    with open(os.environ["GITHUB_OUTPUT"], "a", encoding="utf-8") as f:
+        f.write(lines)
+
+
 def main():
     """메인 실행 함수"""
     print("🔍 PR 변경사항 분석 시작...")
@@ -313,10 +322,7 @@ def main():
         print("❌ 유효한 문제 파일이 없습니다.")
 
         # GitHub Actions 출력 설정
-        if "GITHUB_OUTPUT" in os.environ:
-            with open(os.environ["GITHUB_OUTPUT"], "a", encoding="utf-8") as f:
-                f.write("has_valid_problems=false\n")
-                f.write("total_problems_count=0\n")
+        write_github_output({"has_valid_problems": "false", "total_problems_count": 0})
 
         sys.exit(0)
 
@@ -341,18 +347,16 @@ def main():
             )
 
     # GitHub Actions 출력 설정
-    if "GITHUB_OUTPUT" in os.environ:
-        with open(os.environ["GITHUB_OUTPUT"], "a", encoding="utf-8") as f:
-            f.write(f"has_valid_problems={'true' if valid_problems else 'false'}\n")
-            f.write(f"total_problems_count={len(valid_problems)}\n")
-
-            if valid_problems:
-                # 첫 번째 문제의 정보를 기본값으로 설정 (하위 호환성)
-                first_problem = valid_problems[0]
-                f.write(f"problem_id={first_problem['problem_id']}\n")
-                f.write(f"author={first_problem['author']}\n")
-                f.write(f"code_file={first_problem['code_file']}\n")
-                f.write(f"language={first_problem['language']}\n")
+    outputs = {
+        "has_valid_problems": "true" if valid_problems else "false",
+        "total_problems_count": len(valid_problems),
+    }
+    if valid_problems:
+        # 첫 번째 문제의 정보를 기본값으로 설정 (하위 호환성)
+        first_problem = valid_problems[0]
+        for key in ("problem_id", "author", "code_file", "language"):
+            outputs[key] = first_problem[key]
+    write_github_output(outputs)
 
     print("✅ PR 분석 완료")
 
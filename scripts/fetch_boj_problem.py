@@ -1,41 +1,231 @@
 #!/usr/bin/env python3
 """
 scripts/fetch_boj_problem.py
-최신 Gemini 2.5-flash API의 Google Search 기능을 활용하여 백준 문제 정보를 수집합니다.
+백준 문제 페이지를 직접 조회하여 문제 정보를 수집하고,
+실패 시 최신 Gemini 2.5-flash API의 Google Search 기능으로 대체합니다.
 """
 
 import argparse
+import contextvars
+import hashlib
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+except ImportError:
+    BeautifulSoup = None
+    SoupStrainer = None
+
+# C 확장 파서(lxml)가 설치되어 있으면 사용하고, 없으면 내장 파서를 사용합니다.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# orjson이 설치되어 있으면 더 빠른 JSON 인코더/디코더를 사용합니다.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+BOJ_PROBLEM_URL = "https://www.acmicpc.net/problem/{problem_id}"
+BOJ_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    # User-Agent와 같은 브라우저/버전으로 맞춰 헤더 불일치로 인한 차단을 줄입니다.
+    "Sec-Ch-Ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Ch-Ua-Platform": '"Windows"',
+}
+
+# (연결, 응답 읽기) 타임아웃(초). 연결 실패는 빨리 감지하고 응답은 넉넉히 기다립니다.
+SOLVED_AC_TIMEOUT = (3.05, 12)
+BOJ_TIMEOUT = (3.05, 10)
+
+# 요청마다 새 연결을 맺지 않도록 모듈 전체에서 하나의 세션(커넥션 풀)을 재사용합니다.
+# 일시적인 서버 오류(429/5xx)는 urllib3가 지수 백오프로 재시도합니다.
+SESSION = requests.Session()
+SESSION.headers.update(BOJ_HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+# 문제 본문 요소의 id와 결과 필드 이름의 대응표
+PROBLEM_FIELD_IDS = {
+    "problem_description": "description",
+    "problem_input": "input_format",
+    "problem_output": "output_format",
+    "problem_hint": "hint",
+}
+# 한 번의 탐색으로 모아 둘 요소 id 목록 (본문 필드 + 제한사항 관련 요소)
+PROBLEM_ELEMENT_IDS = frozenset([*PROBLEM_FIELD_IDS, "problem_limit", "problem-info"])
+# 존재하지 않는 문제 페이지에 나타나는 문구
+ERROR_MARKERS = ("존재하지 않는 문제", "해당 문제를 찾을 수 없습니다")
+# 파싱 전에 제거할 <script>/<style> 블록 (MathJax, 분석 스크립트 등)
+SCRIPT_STYLE_PATTERN = re.compile(r"<(script|style)\b.*?</\1\s*>", re.DOTALL | re.IGNORECASE)
+# 예제 입력/출력 요소의 id (예: sample-input-1, sample-output-1)
+SAMPLE_ID_PATTERN = re.compile(r"sample-(input|output)-(\d+)$")
+
+# 백준 페이지 직접 조회를 먼저 시도할지 여부 (--no-prefer-html이면 바로 Gemini 검색)
+PREFER_HTML = True
+
+# 여러 문제를 한 번에 수집할 때 동시에 처리할 최대 문제 수
+BATCH_MAX_WORKERS = 5
+
+# 문제 검색에 사용하는 Gemini 모델
+GEMINI_MODEL = "gemini-2.5-flash"
+# Gemini 응답 필드와 표준 형식 필드의 대응표
+GEMINI_FIELD_MAPPING = {
+    'problem_description': 'description',
+    'input_format': 'input_format',
+    'output_format': 'output_format',
+    'limits': 'limits',
+    'hint': 'hint',
+}
+
+# Gemini 응답에서 JSON을 찾는 패턴 (```json 코드 블록 우선, 없으면 중괄호 범위)
+JSON_BLOCK_PATTERN = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+JSON_OBJECT_PATTERN = re.compile(r'\{.*\}', re.DOTALL)
+
+# 디버그 모드에서만 원본 응답, 메타데이터, 스택 트레이스 등 상세 정보를 출력합니다.
+DEBUG_MODE = os.getenv("DEBUG_MODE") == "true"
+
+# 같은 문제를 다시 조회할 때 네트워크 요청을 생략하기 위한 디스크 캐시
+CACHE_DIR = Path(os.getenv("BOJ_CACHE_DIR", ".cache"))
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+# 최종 조합된 문제 정보는 하루 동안만 재사용합니다. (--cache-ttl-days가 더 짧으면 그 기간까지)
+PROBLEM_CACHE_TTL_SECONDS = 24 * 60 * 60
+# 저장 형식이나 파싱 방식이 바뀌면 올려서 이전 캐시를 무효화합니다.
+CACHE_VERSION = 1
+
+# Gemini 검색 재시도 전체에 허용하는 시간. multi_test_runner는 검색에 별도 제한 시간을 두지 않으므로
+# 문제 하나의 Gemini 검색 시간은 이 값으로만 제한됩니다. (마감 전에 끝나지 않을 시도는 시작하지 않음)
+SEARCH_DEADLINE_SECONDS = 120
+# Gemini 요청 하나의 제한 시간(밀리초). 전체 재시도 마감 시간 안에 최소 두 번은 시도할 수 있도록 합니다.
+GEMINI_TIMEOUT_MS = 50_000
+# Gemini 검색 최대 시도 횟수와, 재시도하지 않을 API 오류 코드
+GEMINI_MAX_RETRIES = 3
+GEMINI_FATAL_STATUS_CODES = (400, 401, 403, 404)
+# 응답 JSON은 보통 1~2K 토큰이므로, 긴 문제 설명에도 잘리지 않을 만큼만 허용합니다.
+GEMINI_MAX_OUTPUT_TOKENS = 4096
+# 응답을 스트리밍으로 받아 JSON이 완성되는 즉시 생성을 끊을지 여부 (--no-stream으로 끔)
+GEMINI_STREAM = True
+
+def is_valid_problem_id(problem_id):
+    """백준 문제 번호 형식(1000 이상 99999 이하의 정수)인지 확인합니다."""
+    problem_id = str(problem_id)
+    return problem_id.isdigit() and 1000 <= int(problem_id) <= 99999
+
+def _cache_path(bucket, problem_id):
+    """캐시 파일 경로를 반환합니다. (예: .cache/solvedac/1000.json)"""
+    return CACHE_DIR / bucket / f"{problem_id}.json"
+
+def read_cache(bucket, problem_id, ttl=None):
+    """유효한 캐시가 있으면 그 내용을, 없거나 만료되었으면 None을 반환합니다."""
+    if os.getenv("BOJ_CACHE_DISABLE"):
+        return None
+    if ttl is None:
+        ttl = CACHE_TTL_SECONDS
+    path = _cache_path(bucket, problem_id)
+    try:
+        with open(path, 'rb') as f:
+            entry = json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION:
+        return None
+    if time.time() - entry.get("fetched_at", 0) > ttl:
+        return None
+    return entry.get("data")
+
+def write_json_atomic(path, data):
+    """JSON을 임시 파일에 쓴 뒤 교체하여, 중간에 중단되어도 깨진 파일이 남지 않도록 합니다."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    # 여러 스레드가 같은 파일을 동시에 써도 임시 파일이 겹치지 않도록 스레드 ID도 붙입니다.
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_cache(bucket, problem_id, data):
+    """조회 결과를 캐시 파일에 저장합니다. 저장 실패는 무시합니다."""
+    if os.getenv("BOJ_CACHE_DISABLE"):
+        return
+    path = _cache_path(bucket, problem_id)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(path, {
+            "version": CACHE_VERSION,
+            "fetched_at": time.time(),
+            "data": data,
+        })
+    except OSError as e:
+        print(f"  ⚠️ 캐시 저장 실패 ({path}): {e}")
 
 def get_solved_ac_info(problem_id):
     """solved.ac API에서 문제의 기본 정보(제목, 레벨, 태그)를 가져옵니다."""
     print("\n📡 solved.ac API에서 정보 조회 중...")
+    if not is_valid_problem_id(problem_id):
+        print(f"  ⚠️ 올바르지 않은 문제 번호입니다: {problem_id}")
+        return {"title": f"문제 {problem_id}", "level": "N/A", "tags": []}
+    cached = read_cache("solvedac", problem_id)
+    if cached:
+        print(f"  ✅ solved.ac 정보 (캐시): {cached.get('title', '')}, 레벨: {cached.get('level', 0)}")
+        return cached
+
     try:
         url = f"https://solved.ac/api/v3/problem/show?problemId={problem_id}"
-        response = requests.get(url, timeout=15)
+        response = SESSION.get(url, timeout=SOLVED_AC_TIMEOUT)
         response.raise_for_status()
 
-        if response.status_code == 200:
-            data = response.json()
-            # 한국어 태그 이름을 우선적으로 찾아서 추출합니다.
-            tags = []
-            for tag_data in data.get("tags", []):
-                korean_name = next((d['name'] for d in tag_data.get('displayNames', []) if d['language'] == 'ko'), None)
-                if korean_name:
-                    tags.append(korean_name)
-            
-            print(f"  ✅ solved.ac 정보: {data.get('titleKo', '')}, 레벨: {data.get('level', 0)}")
-            return {
-                "title": data.get("titleKo", f"문제 {problem_id}"),
-                "level": data.get("level", "N/A"),
-                "tags": tags
-            }
+        data = json_loads(response.content)
+        # 각 태그의 한국어 이름을 추출합니다.
+        tags = [
+            display_name['name']
+            for tag_data in data.get("tags", [])
+            for display_name in tag_data.get('displayNames', [])
+            if display_name.get('language') == 'ko'
+        ]
+
+        print(f"  ✅ solved.ac 정보: {data.get('titleKo', '')}, 레벨: {data.get('level', 0)}")
+        solved_ac_info = {
+            "title": data.get("titleKo", f"문제 {problem_id}"),
+            "level": data.get("level", "N/A"),
+            "tags": tags
+        }
+        write_cache("solvedac", problem_id, solved_ac_info)
+        return solved_ac_info
     except requests.exceptions.RequestException as e:
         print(f"  ⚠️ solved.ac API 호출 오류: {e}")
-    except json.JSONDecodeError:
+    except ValueError:
         print("  ⚠️ solved.ac API 응답이 올바른 JSON 형식이 아닙니다.")
     
     # API 호출 실패 시 기본 정보를 반환합니다.
@@ -45,8 +235,122 @@ def get_solved_ac_info(problem_id):
         "tags": []
     }
 
+def fetch_boj_html_static(problem_id):
+    """requests로 백준 문제 페이지의 HTML을 직접 가져옵니다."""
+    url = BOJ_PROBLEM_URL.format(problem_id=problem_id)
+    response = SESSION.get(url, timeout=BOJ_TIMEOUT)
+    response.raise_for_status()
+    return response.text
+
+def _element_text(element):
+    """요소의 텍스트를 반환합니다. 요소가 없으면 빈 문자열을 반환합니다."""
+    if not element:
+        return ""
+    return element.get_text("\n", strip=True)
+
+def _extract_limits(elements):
+    """문제 정보 표와 제한 섹션에서 제한사항을 추출합니다."""
+    limits = []
+    info_table = elements.get("problem-info")
+    if info_table:
+        headers = [th.get_text(strip=True) for th in info_table.find_all("th")]
+        first_row = info_table.find("tbody")
+        values = [td.get_text(strip=True) for td in first_row.find_all("td")] if first_row else []
+        for header, value in zip(headers, values):
+            if "제한" in header:
+                limits.append(f"{header}: {value}")
+    extra_limit = _element_text(elements.get("problem_limit"))
+    if extra_limit:
+        limits.append(extra_limit)
+    return "\n".join(limits)
+
+def _is_wanted_id(element_id):
+    """본문 필드, 제한사항, 예제 요소의 id인지 확인합니다."""
+    if not element_id:
+        return False
+    return element_id in PROBLEM_ELEMENT_IDS or SAMPLE_ID_PATTERN.match(element_id) is not None
+
+def extract_problem_info_from_html(html_content):
+    """백준 문제 페이지 HTML에서 표준 형식의 문제 정보를 추출합니다."""
+    # 오류 페이지는 문서 전체 텍스트를 만들지 않고 원본 HTML에서 바로 걸러냅니다.
+    if any(marker in html_content for marker in ERROR_MARKERS):
+        return None
+
+    # 본문과 무관한 스크립트/스타일 블록은 파서에 넘기기 전에 잘라냅니다.
+    html_content = SCRIPT_STYLE_PATTERN.sub("", html_content)
+    # 헤더, 사이드바 등은 트리로 만들지 않고 필요한 요소만 파싱합니다.
+    soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=SoupStrainer(id=_is_wanted_id))
+
+    # 필요한 요소와 예제를 id별로 매번 찾지 않고, 문서를 한 번만 훑어 모아 둡니다.
+    elements = {}
+    samples_by_number = {}
+    for element in soup.find_all(id=_is_wanted_id):
+        sample_match = SAMPLE_ID_PATTERN.match(element['id'])
+        if sample_match:
+            kind, number = sample_match.groups()
+            samples_by_number.setdefault(number, {})[kind] = element.get_text().strip()
+        else:
+            elements.setdefault(element['id'], element)
+
+    problem_info = {
+        field: _element_text(elements.get(element_id))
+        for element_id, field in PROBLEM_FIELD_IDS.items()
+    }
+    problem_info['limits'] = _extract_limits(elements)
+    # 값이 없는 필드는 Gemini 변환 결과와 동일하게 생략합니다.
+    problem_info = {key: value for key, value in problem_info.items() if value}
+
+    # 문서 순서대로 번호별 예제를 짝지어, 짝이 끊기는 지점에서 멈춥니다.
+    samples = []
+    for pair in samples_by_number.values():
+        if 'input' not in pair or 'output' not in pair:
+            break
+        samples.append({'input': pair['input'], 'output': pair['output']})
+    problem_info['samples'] = samples
+
+    if not problem_info.get('description') and not samples:
+        return None
+    return problem_info
+
+def get_boj_problem_info_static(problem_id):
+    """백준 문제 페이지를 직접 조회하여 문제 정보를 수집합니다. 실패하면 None을 반환합니다."""
+    print(f"\n🌐 백준 문제 페이지에서 문제 {problem_id} 정보 직접 조회 중...")
+
+    if BeautifulSoup is None:
+        print("  ⚠️ beautifulsoup4 라이브러리가 없어 직접 조회를 건너뜁니다.")
+        return None
+
+    cached = read_cache("boj", problem_id)
+    if cached and cached.get("html"):
+        print("  📦 캐시된 백준 페이지를 사용합니다.")
+        html_content = cached["html"]
+    else:
+        try:
+            html_content = fetch_boj_html_static(problem_id)
+        except requests.exceptions.RequestException as e:
+            print(f"  ⚠️ 백준 페이지 요청 실패: {e}")
+            return None
+
+    # 문제 본문이 없는 페이지(봇 차단, 점검 안내 등)는 파싱하지 않고 바로 대체 경로로 넘어갑니다.
+    if "problem-body" not in html_content:
+        print("  ⚠️ 응답에 문제 본문이 없습니다. Gemini 검색으로 대체합니다.")
+        return None
+
+    problem_info = extract_problem_info_from_html(html_content)
+    if not problem_info or not problem_info.get('samples'):
+        print("  ⚠️ 페이지에서 예제를 찾지 못했습니다. Gemini 검색으로 대체합니다.")
+        return None
+
+    # 정상적으로 파싱된 페이지만 캐시하여 차단 페이지 등이 남지 않도록 합니다.
+    if not cached:
+        write_cache("boj", problem_id, {"html": html_content})
+
+    print(f"  ✅ 직접 조회 성공: 예제 {len(problem_info['samples'])}개")
+    return problem_info
+
+@lru_cache(maxsize=1)
 def setup_gemini_client():
-    """최신 Gemini API 클라이언트를 설정합니다."""
+    """최신 Gemini API 클라이언트를 설정합니다. 한 번 만든 클라이언트는 프로세스 안에서 재사용합니다."""
     api_key = os.getenv('GEMINI_API_KEY')
     if not api_key:
         raise ValueError("GEMINI_API_KEY 환경변수가 설정되지 않았습니다.")
@@ -55,8 +359,11 @@ def setup_gemini_client():
         from google import genai
         from google.genai import types
         
-        # 클라이언트 설정 (공식 문서 방식)
-        client = genai.Client(api_key=api_key)
+        # 클라이언트 설정 (공식 문서 방식). 응답이 멈춘 요청은 제한 시간 후 중단합니다.
+        client = genai.Client(
+            api_key=api_key,
+            http_options=types.HttpOptions(timeout=GEMINI_TIMEOUT_MS)
+        )
         
         print("🔑 최신 Gemini 2.5-flash API 클라이언트 설정 완료")
         return client, types
@@ -69,14 +376,10 @@ def setup_gemini_client():
         print(f"❌ Gemini 클라이언트 설정 실패: {e}")
         raise
 
-def get_boj_problem_with_google_search(client, types, problem_id):
-    """최신 Google Search 기능을 사용하여 백준 문제 정보를 수집합니다."""
-    print(f"\n🤖 Gemini 2.5-flash로 문제 {problem_id} 정보 검색 중...")
-    
-    prompt = f"""
-백준 온라인 저지(BOJ) 문제 {problem_id}번에 대한 정보를 웹에서 검색하여 다음 항목들을 JSON 형식으로 정리해주세요:
-
-검색 대상: https://www.acmicpc.net/problem/{problem_id}
+# 문제마다 바뀌지 않는 검색 지시문. 문제 번호 등 가변 정보보다 앞에 두어
+# 요청 간 프롬프트 앞부분이 동일하게 유지되도록 합니다. (Gemini 암시적 캐싱 대상)
+SEARCH_PROMPT_INSTRUCTIONS = """
+백준 온라인 저지(BOJ) 문제 정보를 웹에서 검색하여 다음 항목들을 JSON 형식으로 정리해주세요.
 
 추출할 정보:
 1. 문제 설명 (problem_description)
@@ -87,22 +390,82 @@ def get_boj_problem_with_google_search(client, types, problem_id):
 6. 힌트 (hint) - 있는 경우만
 
 응답은 반드시 다음과 같은 JSON 형식으로만 해주세요:
-{{
+{
     "problem_description": "문제 설명 내용",
     "input_format": "입력 형식 설명",
     "output_format": "출력 형식 설명", 
     "limits": "제한사항 정보",
     "sample_tests": [
-        {{"input": "예제 입력 1", "output": "예제 출력 1"}},
-        {{"input": "예제 입력 2", "output": "예제 출력 2"}}
+        {"input": "예제 입력 1", "output": "예제 출력 1"},
+        {"input": "예제 입력 2", "output": "예제 출력 2"}
     ],
     "hint": "힌트 내용 (있는 경우)"
-}}
+}
 
 만약 해당 문제를 찾을 수 없으면 "error": "문제를 찾을 수 없습니다" 형태로 응답해주세요.
 HTML 태그는 제거하고 텍스트 내용만 추출해주세요.
+응답은 마크다운 코드펜스나 설명 없이 한 줄로 된 minified JSON으로만 출력해주세요.
+"""
+
+def build_search_prompt(problem_id):
+    """문제 검색에 사용할 Gemini 프롬프트를 만듭니다."""
+    return f"""{SEARCH_PROMPT_INSTRUCTIONS}
+검색할 문제: 백준 {problem_id}번
+검색 대상: {BOJ_PROBLEM_URL.format(problem_id=problem_id)}
 """
 
+def find_json_object(text):
+    """텍스트에서 처음 등장하는, 중괄호 짝이 맞는 JSON 객체 문자열을 반환합니다. 없으면 None을 반환합니다."""
+    start = text.find('{')
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:index + 1]
+    return None
+
+def stream_search_response(client, prompt, config):
+    """응답을 스트리밍으로 받다가 완결된 JSON 객체가 도착하면 바로 중단합니다.
+
+    Returns:
+        (마지막으로 받은 청크, 지금까지 받은 응답 텍스트) 튜플
+    """
+    response_text = ""
+    last_chunk = None
+    for chunk in client.models.generate_content_stream(model=GEMINI_MODEL, contents=prompt, config=config):
+        last_chunk = chunk
+        chunk_text = chunk.text or ""
+        response_text += chunk_text
+        # 닫는 중괄호가 들어온 청크에서만 JSON 완결 여부를 확인합니다.
+        if '}' in chunk_text and find_json_object(response_text):
+            print("  ⚡ 완결된 JSON을 받아 스트리밍을 조기 종료합니다.")
+            break
+    return last_chunk, response_text
+
+def get_boj_problem_with_google_search(client, types, problem_id):
+    """최신 Google Search 기능을 사용하여 백준 문제 정보를 수집합니다."""
+    print(f"\n🤖 Gemini 2.5-flash로 문제 {problem_id} 정보 검색 중...")
+    
+    prompt = build_search_prompt(problem_id)
+
     try:
         # Google Search 도구 정의 (공식 문서 방식)
         grounding_tool = types.Tool(
@@ -113,23 +476,29 @@ HTML 태그는 제거하고 텍스트 내용만 추출해주세요.
         config = types.GenerateContentConfig(
             tools=[grounding_tool],
             temperature=0.1,
-            max_output_tokens=8192
+            max_output_tokens=GEMINI_MAX_OUTPUT_TOKENS,
+            # 검색 결과를 옮겨 적는 작업이므로 추론(thinking) 토큰을 쓰지 않습니다.
+            thinking_config=types.ThinkingConfig(thinking_budget=0)
         )
         
         print("  🔧 API 요청 실행 중...")
         
-        # 요청 실행 (공식 문서 방식)
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=prompt,
-            config=config
-        )
+        if GEMINI_STREAM:
+            response, response_text = stream_search_response(client, prompt, config)
+        else:
+            # 요청 실행 (공식 문서 방식)
+            response = client.models.generate_content(
+                model=GEMINI_MODEL,
+                contents=prompt,
+                config=config
+            )
+            response_text = getattr(response, 'text', None)
         
         print("  ✅ Gemini 2.5-flash 응답 수신 완료")
         
         # 그라운딩 메타데이터 출력 (디버깅용)
         try:
-            if (hasattr(response, 'candidates') and response.candidates and 
+            if DEBUG_MODE and (hasattr(response, 'candidates') and response.candidates and 
                 len(response.candidates) > 0 and response.candidates[0] and
                 hasattr(response.candidates[0], 'grounding_metadata') and 
                 response.candidates[0].grounding_metadata):
@@ -144,19 +513,23 @@ HTML 태그는 제거하고 텍스트 내용만 추출해주세요.
         except Exception as e:
             print(f"  ⚠️ 메타데이터 처리 중 오류 (무시): {e}")
         
-        # 응답 텍스트 추출 (공식 문서 방식 - response.text 사용)
-        if hasattr(response, 'text') and response.text:
-            print(f"  ✅ 응답 텍스트 추출 완료: {len(response.text)}자")
-            return response.text
+        if response_text:
+            print(f"  ✅ 응답 텍스트 추출 완료: {len(response_text)}자")
+            return response_text
         else:
             print("  ❌ 응답에서 텍스트를 찾을 수 없습니다.")
-            print(f"  🔍 전체 응답: {response}")
+            if DEBUG_MODE:
+                print(f"  🔍 전체 응답: {response}")
             return None
         
     except Exception as e:
         print(f"  ❌ Gemini 2.5-flash API 호출 중 오류 발생: {e}")
-        import traceback
-        print(f"  🔍 상세 오류: {traceback.format_exc()}")
+        if DEBUG_MODE:
+            import traceback
+            print(f"  🔍 상세 오류: {traceback.format_exc()}")
+        # 인증 실패, 잘못된 요청 등 다시 시도해도 결과가 같은 오류는 호출한 쪽으로 넘겨 재시도를 멈춥니다.
+        if getattr(e, 'code', None) in GEMINI_FATAL_STATUS_CODES:
+            raise
         return None
 
 def parse_gemini_response(response_text):
@@ -167,23 +540,32 @@ def parse_gemini_response(response_text):
         return None
     
     try:
-        # JSON 블록 찾기 (```json ... ``` 형태)
-        import re
-        json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
-        if json_match:
-            json_text = json_match.group(1)
-        else:
-            # JSON 블록이 없으면 전체 텍스트에서 JSON 찾기
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+        # 지시대로 JSON만 응답한 경우 정규식 탐색 없이 바로 파싱합니다.
+        try:
+            problem_data = json_loads(response_text.strip())
+        except ValueError:
+            problem_data = None
+
+        if not isinstance(problem_data, dict):
+            # JSON 블록 찾기 (```json ... ``` 형태)
+            json_match = JSON_BLOCK_PATTERN.search(response_text)
             if json_match:
-                json_text = json_match.group(0)
+                json_text = json_match.group(1)
             else:
-                print("  ⚠️ JSON 형식을 찾을 수 없습니다.")
-                print(f"  📄 원본 응답: {response_text[:500]}...")
-                return None
-        
-        # JSON 파싱
-        problem_data = json.loads(json_text)
+                # JSON 블록이 없으면 중괄호 짝이 맞는 첫 번째 객체를 찾고,
+                # 그래도 없으면 가장 넓은 중괄호 범위를 사용합니다.
+                json_text = find_json_object(response_text)
+                if json_text is None:
+                    json_match = JSON_OBJECT_PATTERN.search(response_text)
+                    if not json_match:
+                        print("  ⚠️ JSON 형식을 찾을 수 없습니다.")
+                        if DEBUG_MODE:
+                            print(f"  📄 원본 응답: {response_text[:500]}...")
+                        return None
+                    json_text = json_match.group(0)
+            
+            # JSON 파싱
+            problem_data = json_loads(json_text)
         
         # 오류 확인
         if 'error' in problem_data:
@@ -193,9 +575,10 @@ def parse_gemini_response(response_text):
         print("  ✅ JSON 파싱 완료")
         return problem_data
         
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"  ❌ JSON 파싱 오류: {e}")
-        print(f"  📄 원본 응답: {response_text[:500]}...")
+        if DEBUG_MODE:
+            print(f"  📄 원본 응답: {response_text[:500]}...")
         return None
 
 def convert_to_standard_format(gemini_data):
@@ -204,16 +587,7 @@ def convert_to_standard_format(gemini_data):
     
     standard_format = {}
     
-    # 필드 매핑
-    field_mapping = {
-        'problem_description': 'description',
-        'input_format': 'input_format', 
-        'output_format': 'output_format',
-        'limits': 'limits',
-        'hint': 'hint'
-    }
-    
-    for gemini_field, standard_field in field_mapping.items():
+    for gemini_field, standard_field in GEMINI_FIELD_MAPPING.items():
         if gemini_field in gemini_data and gemini_data[gemini_field]:
             standard_format[standard_field] = gemini_data[gemini_field]
     
@@ -233,33 +607,59 @@ def convert_to_standard_format(gemini_data):
     print("  ✅ 데이터 형식 변환 완료")
     return standard_format
 
-def get_boj_problem_info_with_search(problem_id, max_retries=3):
+def retry_delay(attempt, base=2.0, cap=8.0):
+    """재시도 전 대기 시간(초)을 지수 백오프 + 지터로 계산합니다."""
+    return min(cap, base * 2 ** (attempt - 1)) + random.uniform(0, 1)
+
+def get_boj_problem_info_with_search(problem_id, max_retries=None):
     """최신 Google Search를 사용하여 백준 문제 정보를 수집합니다."""
+    if max_retries is None:
+        max_retries = GEMINI_MAX_RETRIES
+    if not is_valid_problem_id(problem_id):
+        print(f"❌ 올바르지 않은 문제 번호입니다: {problem_id}")
+        return None
     print(f"\n🎯 문제 {problem_id} 정보 수집 시작 (Gemini 2.5-flash + Google Search)")
     
+    # 같은 모델과 프롬프트로 이미 수집한 결과가 있으면 API를 다시 호출하지 않습니다.
+    prompt_hash = hashlib.sha256(f"{GEMINI_MODEL}\n{build_search_prompt(problem_id)}".encode('utf-8')).hexdigest()[:16]
+    cache_key = f"{problem_id}-{prompt_hash}"
+    cached = read_cache("gemini", cache_key)
+    if cached:
+        print("  📦 캐시된 Gemini 검색 결과를 사용합니다.")
+        return cached
+
     try:
         client, types = setup_gemini_client()
     except Exception as e:
         print(f"❌ Gemini 클라이언트 설정 실패: {e}")
         return None
     
+    # 재시도 대기를 합산하지 않고 전체 작업 시간을 하나의 마감 시각으로 제한합니다.
+    deadline = time.monotonic() + SEARCH_DEADLINE_SECONDS
     for attempt in range(1, max_retries + 1):
+        if attempt > 1:
+            delay = retry_delay(attempt - 1)
+            if time.monotonic() + delay + GEMINI_TIMEOUT_MS / 1000 > deadline:
+                print(f"  ⏱️ 제한 시간({SEARCH_DEADLINE_SECONDS}초)을 넘겨 재시도를 중단합니다.")
+                break
+            time.sleep(delay)
+
         print(f"\n  🔄 시도 {attempt}/{max_retries}")
         
         # Google Search로 정보 수집
-        response_text = get_boj_problem_with_google_search(client, types, problem_id)
+        try:
+            response_text = get_boj_problem_with_google_search(client, types, problem_id)
+        except Exception:
+            print("  ⛔ 재시도해도 해결되지 않는 오류이므로 재시도를 중단합니다.")
+            break
         if not response_text:
             print(f"  ⚠️ 시도 {attempt} 실패")
-            if attempt < max_retries:
-                time.sleep(2)
             continue
         
         # 응답 파싱
         problem_data = parse_gemini_response(response_text)
         if not problem_data:
             print(f"  ⚠️ 시도 {attempt} 파싱 실패")
-            if attempt < max_retries:
-                time.sleep(2)
             continue
         
         # 표준 형식으로 변환
@@ -268,43 +668,53 @@ def get_boj_problem_info_with_search(problem_id, max_retries=3):
         # 최소한의 데이터라도 있으면 성공으로 간주
         if standard_data and (standard_data.get('description') or standard_data.get('samples')):
             print("  🎉 문제 정보 수집 성공!")
+            write_cache("gemini", cache_key, standard_data)
             return standard_data
         
         print(f"  ⚠️ 시도 {attempt} - 유효한 데이터 없음")
-        if attempt < max_retries:
-            time.sleep(2)
     
     print("💥 모든 시도 실패")
     return None
 
-def main():
-    """메인 실행 함수"""
-    parser = argparse.ArgumentParser(description='Gemini 2.5-flash Google Search를 활용한 백준 문제 정보 수집')
-    parser.add_argument('--problem-id', required=True, help='수집할 백준 문제의 번호')
-    # --output 인자를 받도록 추가합니다. (필수)
-    parser.add_argument('--output', required=True, help='문제 정보를 저장할 JSON 파일 경로')
-    args = parser.parse_args()
+def get_boj_problem_details(problem_id):
+    """백준 페이지를 먼저 직접 조회하고, 실패한 경우에만 Gemini 검색을 사용합니다.
 
-    problem_id = args.problem_id
-    problem_info_output_path = args.output
-    # 샘플 테스트 파일 경로는 문제 ID를 기반으로 동적으로 생성합니다.
-    sample_tests_output_path = f"sample_{problem_id}_tests.json"
+    Returns:
+        (상세 정보 dict 또는 None, 출처 문자열) 튜플
+    """
+    if PREFER_HTML:
+        boj_details = get_boj_problem_info_static(problem_id)
+        if boj_details:
+            return boj_details, "boj-html"
 
     # GEMINI_API_KEY 환경변수 확인
     if not os.getenv('GEMINI_API_KEY'):
         print("❌ GEMINI_API_KEY 환경변수를 설정해주세요.")
         print("   export GEMINI_API_KEY='your_api_key_here'")
-        exit(1)
-    
-    # solved.ac API로 기본 정보 수집
-    solved_ac_info = get_solved_ac_info(problem_id)
-    
+        return None, None
+
     # Gemini 2.5-flash Google Search로 상세 정보 수집
-    boj_details = get_boj_problem_info_with_search(problem_id)
+    return get_boj_problem_info_with_search(problem_id), "gemini-2.5-flash-search"
+
+def collect_problem_info(problem_id):
+    """문제 하나의 정보를 수집합니다. 실패하면 (None, None)을 반환합니다."""
+    # CACHE_TTL_SECONDS는 main에서 --cache-ttl-days로 바뀌므로 호출할 때 읽습니다.
+    cached = read_cache("problem", problem_id, ttl=min(PROBLEM_CACHE_TTL_SECONDS, CACHE_TTL_SECONDS))
+    if cached:
+        print(f"\n📦 캐시된 문제 {problem_id} 정보를 사용합니다.")
+        return cached["info"], cached["source"]
+
+    # solved.ac API 조회와 백준 상세 정보 수집은 서로 독립적이므로 동시에 진행합니다.
+    # 호출한 쪽의 컨텍스트를 복사해 실행하여, 작업 스레드의 출력도 호출한 쪽과 같은 곳(예: 문제별 로그)에 남깁니다.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        solved_ac_future = executor.submit(contextvars.copy_context().run, get_solved_ac_info, problem_id)
+        details_future = executor.submit(contextvars.copy_context().run, get_boj_problem_details, problem_id)
+        solved_ac_info = solved_ac_future.result()
+        boj_details, source = details_future.result()
 
     if not boj_details:
         print(f"\n❌ 문제 {problem_id} 정보 수집 최종 실패")
-        exit(1)
+        return None, None
 
     # 최종 정보 조합
     complete_info = { 
@@ -312,33 +722,97 @@ def main():
         **solved_ac_info, 
         **boj_details 
     }
+    # solved.ac 조회에 실패한 기본값(레벨 N/A)은 다음 실행에서 다시 조회하도록 캐시하지 않습니다.
+    if complete_info["level"] != "N/A":
+        write_cache("problem", problem_id, {"info": complete_info, "source": source})
+    return complete_info, source
 
-    try:
-        # 문제 정보 저장 (인자로 받은 경로 사용)
-        with open(problem_info_output_path, 'w', encoding='utf-8') as f:
-            json.dump(complete_info, f, ensure_ascii=False, indent=2)
-        
-        # 예제 테스트케이스 저장
-        sample_tests = { 
-            "problem_id": problem_id, 
-            "test_cases": complete_info.get('samples', []),
-            "source": "gemini-2.5-flash-search"
-        }
-        with open(sample_tests_output_path, 'w', encoding='utf-8') as f:
-            json.dump(sample_tests, f, ensure_ascii=False, indent=2)
-
-        print("\n" + "="*60)
-        print("🎉 Gemini 2.5-flash Google Search 정보 수집 완료!")
-        print(f" 📝 제목: {complete_info['title']} (레벨: {complete_info['level']})")
-        print(f" 🏷️ 태그: {', '.join(complete_info.get('tags', []))}")
-        print(f" 📊 추출된 예제: {len(complete_info.get('samples', []))}개")
-        print(f" 📄 문제 설명 길이: {len(complete_info.get('description', ''))}자")
-        print(f" 💾 저장된 파일: {problem_info_output_path}, {sample_tests_output_path}")
-        print("="*60)
+def save_problem_info(problem_id, complete_info, source, problem_info_output_path):
+    """문제 정보와 예제 테스트케이스를 파일로 저장합니다."""
+    # 샘플 테스트 파일 경로는 문제 ID를 기반으로 동적으로 생성합니다.
+    sample_tests_output_path = f"sample_{problem_id}_tests.json"
 
+    # 문제 정보 저장
+    write_json_atomic(problem_info_output_path, complete_info)
+    
+    # 예제 테스트케이스 저장
+    sample_tests = { 
+        "problem_id": problem_id, 
+        "test_cases": complete_info.get('samples', []),
+        "source": source
+    }
+    write_json_atomic(sample_tests_output_path, sample_tests)
+
+    print("\n" + "="*60)
+    print(f"🎉 문제 정보 수집 완료! (출처: {source})")
+    print(f" 📝 제목: {complete_info['title']} (레벨: {complete_info['level']})")
+    print(f" 🏷️ 태그: {', '.join(complete_info.get('tags', []))}")
+    print(f" 📊 추출된 예제: {len(complete_info.get('samples', []))}개")
+    print(f" 📄 문제 설명 길이: {len(complete_info.get('description', ''))}자")
+    print(f" 💾 저장된 파일: {problem_info_output_path}, {sample_tests_output_path}")
+    print("="*60)
+
+def process_problem(problem_id, problem_info_output_path):
+    """문제 하나를 수집하고 저장합니다. 성공 여부를 반환합니다."""
+    complete_info, source = collect_problem_info(problem_id)
+    if not complete_info:
+        return False
+
+    try:
+        save_problem_info(problem_id, complete_info, source, problem_info_output_path)
     except IOError as e:
         print(f"\n❌ 파일 저장 중 오류가 발생했습니다: {e}")
+        return False
+    return True
+
+def main():
+    """메인 실행 함수"""
+    global CACHE_TTL_SECONDS, GEMINI_MAX_RETRIES, GEMINI_STREAM, PREFER_HTML
+    parser = argparse.ArgumentParser(description='백준 페이지 직접 조회 및 Gemini 2.5-flash Google Search를 활용한 백준 문제 정보 수집')
+    parser.add_argument('--problem-id', required=True, nargs='+',
+                        help='수집할 백준 문제의 번호 (여러 개는 공백 또는 쉼표로 구분)')
+    parser.add_argument('--output', help='문제 정보를 저장할 JSON 파일 경로 (문제가 하나일 때만 사용, 기본값: problem_{번호}_info.json)')
+    parser.add_argument('--no-cache', action='store_true', help='디스크 캐시를 읽거나 쓰지 않습니다.')
+    parser.add_argument('--cache-ttl-days', type=float, default=CACHE_TTL_SECONDS / 86400,
+                        help='solved.ac, 백준 페이지, Gemini 검색 결과 캐시의 유효 기간(일). 조합된 문제 정보는 최대 1일')
+    parser.add_argument('--max-retries', type=int, default=GEMINI_MAX_RETRIES,
+                        help='Gemini 검색 최대 시도 횟수')
+    parser.add_argument('--prefer-html', action=argparse.BooleanOptionalAction, default=PREFER_HTML,
+                        help='백준 페이지 직접 조회를 먼저 시도하고 실패할 때만 Gemini 검색을 사용합니다.')
+    parser.add_argument('--no-stream', action='store_true',
+                        help='Gemini 응답을 스트리밍하지 않고 한 번에 받습니다. (디버깅용)')
+    args = parser.parse_args()
+
+    # 같은 문제가 여러 번 주어지면 한 번만 수집합니다. (같은 출력 파일을 동시에 쓰지 않도록)
+    problem_ids = list(dict.fromkeys(pid for value in args.problem_id for pid in value.split(',') if pid))
+    invalid_ids = [pid for pid in problem_ids if not is_valid_problem_id(pid)]
+    if invalid_ids:
+        parser.error(f"올바르지 않은 문제 번호입니다: {', '.join(invalid_ids)} (1000~99999 사이의 숫자)")
+    if args.output and len(problem_ids) > 1:
+        parser.error("--output은 문제를 하나만 수집할 때 사용할 수 있습니다.")
+
+    CACHE_TTL_SECONDS = args.cache_ttl_days * 86400
+    GEMINI_MAX_RETRIES = args.max_retries
+    GEMINI_STREAM = not args.no_stream
+    PREFER_HTML = args.prefer_html
+    if args.no_cache:
+        os.environ["BOJ_CACHE_DISABLE"] = "1"
+
+    output_paths = [args.output or f"problem_{pid}_info.json" for pid in problem_ids]
+
+    if len(problem_ids) == 1:
+        results = [process_problem(problem_ids[0], output_paths[0])]
+    else:
+        # 여러 문제는 제한된 개수만 동시에 수집하여 API 부하를 조절합니다.
+        print(f"📦 문제 {len(problem_ids)}개를 최대 {BATCH_MAX_WORKERS}개씩 동시에 수집합니다.")
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+            results = list(executor.map(process_problem, problem_ids, output_paths))
+
+    failed = [pid for pid, ok in zip(problem_ids, results) if not ok]
+    if failed:
+        if len(problem_ids) > 1:
+            print(f"\n❌ 수집 실패한 문제: {', '.join(failed)}")
         exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -8,9 +8,17 @@ import argparse
 import json
 import os
 import sys
+from functools import lru_cache
 
+# 디버그 모드에서만 원본 응답, 스택 트레이스 등 상세 정보를 출력합니다.
+DEBUG_MODE = os.getenv("DEBUG_MODE") == "true"
+# 테스트 생성 요청의 최대 대기 시간(밀리초). multi_test_runner.py가 이 모듈을 직접 호출하므로
+# 프로세스 타임아웃 대신 요청 단위로 대기 시간을 제한합니다.
+GEMINI_TIMEOUT_MS = 150_000
+
+@lru_cache(maxsize=1)
 def setup_gemini_client():
-    """최신 Gemini API 클라이언트를 설정합니다."""
+    """최신 Gemini API 클라이언트를 설정합니다. 한 번 만든 클라이언트는 프로세스 안에서 재사용합니다."""
     api_key = os.getenv('GEMINI_API_KEY')
     if not api_key:
         raise ValueError("GEMINI_API_KEY 환경변수가 설정되지 않았습니다.")
@@ -19,8 +27,11 @@ def setup_gemini_client():
         from google import genai
         from google.genai import types
         
-        # 클라이언트 설정 (공식 문서 방식)
-        client = genai.Client(api_key=api_key)
+        # 클라이언트 설정 (공식 문서 방식). 응답이 멈춘 요청은 제한 시간 후 중단합니다.
+        client = genai.Client(
+            api_key=api_key,
+            http_options=types.HttpOptions(timeout=GEMINI_TIMEOUT_MS)
+        )
         
         print("🔑 최신 Gemini 2.5-flash API 클라이언트 설정 완료")
         return client, types
@@ -122,8 +133,9 @@ def generate_test_cases(client, types, problem_info, code_content, language):
         
     except Exception as e:
         print(f"  ❌ 테스트케이스 생성 중 오류 발생: {e}")
-        import traceback
-        print(f"  🔍 상세 오류: {traceback.format_exc()}")
+        if DEBUG_MODE:
+            import traceback
+            print(f"  🔍 상세 오류: {traceback.format_exc()}")
         return None
 
 def parse_test_cases(response_text):
@@ -147,7 +159,8 @@ def parse_test_cases(response_text):
                 json_text = json_match.group(0)
             else:
                 print("  ⚠️ JSON 형식을 찾을 수 없습니다.")
-                print(f"  📄 원본 응답: {response_text[:500]}...")
+                if DEBUG_MODE:
+                    print(f"  📄 원본 응답: {response_text[:500]}...")
                 return []
         
         # JSON 파싱
@@ -178,7 +191,8 @@ def parse_test_cases(response_text):
         
     except json.JSONDecodeError as e:
         print(f"  ❌ JSON 파싱 오류: {e}")
-        print(f"  📄 원본 응답: {response_text[:500]}...")
+        if DEBUG_MODE:
+            print(f"  📄 원본 응답: {response_text[:500]}...")
         return []
     except Exception as e:
         print(f"  ❌ 테스트케이스 파싱 중 예상치 못한 오류: {e}")
@@ -215,6 +229,30 @@ def validate_test_cases(test_cases, problem_info):
     print(f"  ✅ {len(validated_cases)}개의 테스트케이스가 검증을 통과했습니다.")
     return validated_cases
 
+def generate_tests(problem_id, problem_info, code_content, language):
+    """반례 테스트케이스를 생성하고 검증하여 결과 딕셔너리를 반환합니다. 생성에 실패하면 None을 반환합니다."""
+    client, types = setup_gemini_client()
+    response_text = generate_test_cases(client, types, problem_info, code_content, language)
+    
+    if not response_text:
+        print("❌ 테스트케이스 생성 실패")
+        return None
+    
+    test_cases = parse_test_cases(response_text)
+    validated_cases = validate_test_cases(test_cases, problem_info)
+    
+    if not validated_cases:
+        print("⚠️ 생성된 유효한 테스트케이스가 없습니다.")
+        validated_cases = []
+    
+    return {
+        "problem_id": problem_id,
+        "test_cases": validated_cases,
+        "generated_by": "gemini-2.5-flash",
+        "language": language,
+        "total_generated": len(validated_cases)
+    }
+
 def main():
     """메인 실행 함수"""
     parser = argparse.ArgumentParser(description='Gemini 2.5-flash API를 사용한 반례 테스트케이스 생성')
@@ -254,29 +292,10 @@ def main():
         sys.exit(1)
     
     try:
-        # ... (Gemini 클라이언트 설정 및 테스트 생성 로직은 동일) ...
-        client, types = setup_gemini_client()
-        response_text = generate_test_cases(client, types, problem_info, code_content, args.language)
-        
-        if not response_text:
-            print("❌ 테스트케이스 생성 실패")
+        result = generate_tests(args.problem_id, problem_info, code_content, args.language)
+        if result is None:
             sys.exit(1)
-        
-        test_cases = parse_test_cases(response_text)
-        validated_cases = validate_test_cases(test_cases, problem_info)
-        
-        if not validated_cases:
-            print("⚠️ 생성된 유효한 테스트케이스가 없습니다.")
-            validated_cases = []
-        
-        # 결과 저장
-        result = {
-            "problem_id": args.problem_id,
-            "test_cases": validated_cases,
-            "generated_by": "gemini-2.5-flash",
-            "language": args.language,
-            "total_generated": len(validated_cases)
-        }
+        validated_cases = result["test_cases"]
         
         # 인자로 받은 --output 경로에 파일 저장
         with open(args.output, 'w', encoding='utf-8') as f:
@@ -4,21 +4,66 @@ scripts/multi_test_runner.py
 다중 문제 테스트 실행 및 결과 통합 (기존 test_runner.py 기능 포함)
 """
 
+import contextvars
+import hashlib
+import io
 import json
+import math
 import os
+import re
+import select
+import shutil
 import sys
 import subprocess
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# 문제 정보 수집과 테스트 생성은 별도 Python 프로세스를 띄우지 않고 같은 프로세스에서 호출합니다.
+import fetch_boj_problem
+import gemini_test_generator
+
+# 코드와 테스트케이스가 같으면 이전 실행 결과(판정)를 재사용하기 위한 캐시
+VERDICT_CACHE_DIR = Path(os.getenv("BOJ_CACHE_DIR", ".cache")) / "verdicts"
+# 실행/비교 방식이 바뀌면 올려서 이전 판정을 무효화합니다.
+VERDICT_CACHE_VERSION = 1
+# 문제별 전체 결과(테스트케이스별 상세 포함)를 완료되는 대로 한 줄씩 기록하는 파일
+RESULTS_LOG_PATH = 'test_results.ndjson'
+# 로그에 출력할 입력/출력 repr의 최대 길이 (큰 테스트케이스가 CI 로그를 채우지 않도록 자름)
+LOG_REPR_LIMIT = 200
+# 디버그 모드에서는 입력/출력을 자르지 않고 모두 출력합니다.
+DEBUG_MODE = os.getenv("DEBUG_MODE") == "true"
+# 문제 정보에서 시간 제한을 찾지 못했을 때의 실행 제한 시간(초)과 최대 제한 시간
+DEFAULT_RUN_TIMEOUT = 5
+MAX_RUN_TIMEOUT = 10
+# 문제 제한사항의 시간 제한 (예: "시간 제한: 2 초", "시간 제한: 0.5 초 (추가 시간 없음)")
+# (dict로 받은 제한사항을 문자열로 바꾼 "{'시간 제한': '2 초'}" 형태도 허용)
+TIME_LIMIT_PATTERN = re.compile(r'시간\s*제한[\'"]?\s*:?\s*[\'"]?\s*(\d+(?:\.\d+)?)\s*초')
+# 실수 출력 문제의 허용 오차 (예: "절대/상대 오차는 10-9까지 허용한다", "10^-6 이하의 오차")
+# 지수는 1 이상이어야 하고, 같은 줄의 가까운 곳에 "오차"가 있어야 합니다.
+ERROR_TOLERANCE_PATTERN = re.compile(
+    r'오차[^\n]{0,40}?10\s*\^?\s*-\s*([1-9]\d*)|10\s*\^?\s*-\s*([1-9]\d*)[^\n]{0,10}?오차'
+)
+# 한 테스트 스위트에서 이 개수만큼 실패하면 남은 테스트를 건너뜁니다. (0이면 끝까지 실행)
+FAIL_FAST_AFTER = int(os.getenv("FAIL_FAST_AFTER", "0"))
+# 테스트별 상세 결과는 테스트마다 dict를 만들지 않고 필드별 리스트로 모아 둡니다. (i번째 테스트 = 각 리스트의 i번째 값)
+DETAIL_FIELDS = ('passed', 'input', 'expected', 'actual', 'error', 'execution_time', 'description')
+
+def empty_details():
+    """필드별 리스트로 된 빈 상세 결과를 만듭니다."""
+    return {field: [] for field in DETAIL_FIELDS}
+
 class TestResult:
     """단일 문제의 테스트 결과를 저장하는 클래스"""
     def __init__(self):
         self.sample_tests = {
-            'total': 0, 'passed': 0, 'failed': 0, 'details': []
+            'total': 0, 'passed': 0, 'failed': 0, 'details': empty_details()
         }
         self.generated_tests = {
-            'total': 0, 'passed': 0, 'failed': 0, 'details': []
+            'total': 0, 'passed': 0, 'failed': 0, 'details': empty_details()
         }
         self.compilation_success = False
         self.compilation_error = ""
@@ -26,42 +71,79 @@ class TestResult:
         self.error_messages = []
         self.execution_time = 0
 
-def compile_java_code(code_file):
-    """Java 코드를 컴파일합니다."""
+# 실행 파일을 경로로 지정하고 close_fds=False로 실행하면 subprocess가 fork+exec 대신
+# posix_spawn을 사용하므로, java/javac 경로를 한 번만 찾아 둡니다. (파이썬 파일 디스크립터는 기본적으로 상속되지 않음)
+JAVA_BIN = shutil.which('java') or 'java'
+JAVAC_BIN = shutil.which('javac') or 'javac'
+
+# javac도 JVM 위에서 실행되므로, 짧은 컴파일에 맞게 C1 컴파일러만 쓰고 가벼운 GC를 사용합니다.
+JAVAC_JVM_OPTIONS = ['-J-XX:TieredStopAtLevel=1', '-J-XX:+UseSerialGC', '-J-Xshare:auto']
+
+# 컴파일된 클래스 파일은 제출 디렉토리 대신 메모리 기반 파일시스템(/dev/shm)의 임시 디렉토리에 둡니다.
+CLASS_DIR_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# javac 실행 제한 시간(초)
+COMPILE_TIMEOUT = 30
+
+def start_java_compile(code_file, class_dir=None):
+    """javac를 기다리지 않고 시작합니다. (프로세스, 시작 실패 시 오류 메시지)를 반환합니다.
+
+    컴파일하는 동안 호출한 쪽에서 다른 일(문제 검색 등)을 할 수 있도록 하고, 결과는 wait_java_compile로 받습니다.
+    class_dir을 주면 클래스 파일을 그 디렉토리에 생성합니다.
+    """
     print(f"⚙️ Java 코드 컴파일 중: {code_file}")
+    output_options = ['-d', class_dir] if class_dir else []
     try:
-        result = subprocess.run(
-            ['javac', '-encoding', 'UTF-8', code_file],
-            capture_output=True, text=True, timeout=30
+        process = subprocess.Popen(
+            [JAVAC_BIN, *JAVAC_JVM_OPTIONS, '-encoding', 'UTF-8', *output_options, code_file],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, close_fds=False
         )
-        if result.returncode == 0:
-            print("✅ 컴파일 성공")
-            return True, ""
-        else:
-            error_msg = result.stderr or result.stdout or "알 수 없는 컴파일 오류"
-            print(f"❌ 컴파일 실패: {error_msg}")
-            return False, error_msg
-    except subprocess.TimeoutExpired:
-        error_msg = "컴파일 시간 초과 (30초)"
-        print(f"❌ {error_msg}")
-        return False, error_msg
+        return process, ""
     except Exception as e:
-        error_msg = f"컴파일 중 오류: {str(e)}"
+        return None, f"컴파일 중 오류: {str(e)}"
+
+def wait_java_compile(process, start_error=""):
+    """start_java_compile로 시작한 javac가 끝나기를 기다려 (성공 여부, 오류 메시지)를 반환합니다."""
+    if process is None:
+        print(f"❌ {start_error}")
+        return False, start_error
+    try:
+        stdout, stderr = process.communicate(timeout=COMPILE_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        error_msg = f"컴파일 시간 초과 ({COMPILE_TIMEOUT}초)"
         print(f"❌ {error_msg}")
         return False, error_msg
 
+    if process.returncode == 0:
+        print("✅ 컴파일 성공")
+        return True, ""
+    error_msg = stderr or stdout or "알 수 없는 컴파일 오류"
+    print(f"❌ 컴파일 실패: {error_msg}")
+    return False, error_msg
+
+# 각 줄 앞뒤의 공백 (줄바꿈 제외). 줄 단위로 나누지 않고 한 번에 제거합니다.
+LINE_EDGE_WHITESPACE = re.compile(r'^[^\S\n]+|[^\S\n]+$', re.MULTILINE)
+
+# 테스트마다 새로 띄우는 짧은 실행용 JVM 옵션 (C1 컴파일러만 사용, 클래스 데이터 공유, 가벼운 GC)
+JAVA_JVM_OPTIONS = ['-XX:TieredStopAtLevel=1', '-XX:+UseSerialGC', '-Xshare:auto']
+# 하네스는 여러 테스트 동안 살아 있으므로 C2 JIT는 유지합니다.
+HARNESS_JVM_OPTIONS = ['-XX:+UseSerialGC', '-Xshare:auto']
+
 def run_java_program(code_dir, class_name, input_data, timeout=5):
     """Java 프로그램을 실행하고 결과를 반환합니다."""
     try:
         start_time = time.time()
         # ✨ [수정] -cp 옵션으로 클래스 경로를 지정하여 ClassNotFoundException 해결
         process = subprocess.run(
-            ['java', '-cp', code_dir, class_name],
+            [JAVA_BIN, *JAVA_JVM_OPTIONS, '-cp', code_dir, class_name],
             input=input_data,
             capture_output=True,
             text=True,
             encoding='utf-8',
-            timeout=timeout
+            timeout=timeout,
+            close_fds=False
         )
         execution_time = time.time() - start_time
         
@@ -75,32 +157,284 @@ def run_java_program(code_dir, class_name, input_data, timeout=5):
     except Exception as e:
         return False, "", 0, f"실행 중 오류: {str(e)}"
 
+# 테스트마다 JVM을 새로 띄우지 않도록 제출 코드를 반복 실행하는 하네스 (scripts/TestHarness.java)
+HARNESS_SOURCE = Path(__file__).with_name("TestHarness.java")
+_harness_lock = threading.Lock()
+_harness_dir = None
+_harness_compile_failed = False
+# 하네스 응답을 읽을 때 한 번에 읽는 최소/최대 바이트 수
+HARNESS_READ_SIZE = 64 * 1024
+HARNESS_MAX_READ_SIZE = 4 * 1024 * 1024
+# 하네스가 제한 시간 초과를 직접 알려 줄 수 있도록 응답을 기다리는 여유 시간(초)
+HARNESS_GRACE_SECONDS = 1
+# 표준 입출력의 fd(0/1)에 직접 접근하는 제출 코드 (예: new FileInputStream(FileDescriptor.in)).
+# 하네스에서는 테스트별 입출력을 연결할 수 없으므로 테스트마다 JVM을 실행합니다.
+RAW_STDIO_PATTERN = re.compile(r'\bFileDescriptor\s*\.\s*(?:in|out|err)\b|/dev/std(?:in|out|err)|/proc/self/fd')
+
+def compile_test_harness():
+    """하네스를 한 번만 컴파일하고 클래스 디렉토리를 반환합니다. 실패하면 None을 반환합니다."""
+    global _harness_dir, _harness_compile_failed
+    with _harness_lock:
+        if _harness_dir or _harness_compile_failed:
+            return _harness_dir
+        output_dir = tempfile.mkdtemp(prefix="boj-harness-")
+        try:
+            result = subprocess.run(
+                [JAVAC_BIN, *JAVAC_JVM_OPTIONS, '-encoding', 'UTF-8', '-d', output_dir, str(HARNESS_SOURCE)],
+                capture_output=True, text=True, timeout=60, close_fds=False
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            result = None
+            print(f"⚠️ 테스트 하네스 컴파일 실패, 테스트마다 JVM을 실행합니다: {e}")
+        if result is not None and result.returncode != 0:
+            print(f"⚠️ 테스트 하네스 컴파일 실패, 테스트마다 JVM을 실행합니다: {result.stderr.strip()}")
+        if result is None or result.returncode != 0:
+            _harness_compile_failed = True
+            return None
+        _harness_dir = output_dir
+        return _harness_dir
+
+class JavaHarness:
+    """하나의 JVM에서 제출 코드를 테스트케이스마다 실행하는 하네스 프로세스를 관리합니다.
+
+    하네스를 쓸 수 없거나 하네스 프로세스가 비정상 종료하면 run_java_program으로 대체합니다.
+    제한 시간 안에 끝나지 않았거나(TIMEOUT) 제출 코드가 만든 스레드가 남아 있는(RETRY) 테스트도
+    하네스 안의 상태와 무관하게 판정하도록 테스트마다 JVM을 실행하는 방식으로 다시 실행합니다.
+    요청/응답은 표준 입출력이 아닌 별도 파이프로 주고받으며, 표준 입출력 fd에 직접 접근하는 코드는
+    하네스를 쓰지 않습니다.
+    """
+    def __init__(self, code_dir, class_name, source=None):
+        self.code_dir = code_dir
+        self.class_name = class_name
+        self.process = None
+        self._requests = None
+        self._responses = None
+        if source is not None and RAW_STDIO_PATTERN.search(source):
+            print("ℹ️ 표준 입출력 fd에 직접 접근하는 코드이므로 테스트마다 JVM을 실행합니다.")
+            self.disabled = True
+        else:
+            self.disabled = compile_test_harness() is None
+        self._buffer = bytearray()
+
+    def _start(self):
+        request_read, request_write = os.pipe()
+        response_read, response_write = os.pipe()
+        try:
+            self.process = subprocess.Popen(
+                [JAVA_BIN, *HARNESS_JVM_OPTIONS, '-cp', _harness_dir, 'TestHarness', self.code_dir, self.class_name,
+                 f"/dev/fd/{request_read}", f"/dev/fd/{response_write}"],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                pass_fds=(request_read, response_write)
+            )
+        except Exception:
+            os.close(request_write)
+            os.close(response_read)
+            raise
+        finally:
+            # 하네스 쪽 끝은 닫아 두어야 하네스가 종료했을 때 응답 파이프에서 EOF를 받습니다.
+            os.close(request_read)
+            os.close(response_write)
+        self._requests = os.fdopen(request_write, 'wb')
+        self._responses = response_read
+        self._buffer = bytearray()
+
+    def _read(self, size, deadline):
+        """deadline까지 size 바이트(size가 None이면 한 줄)를 읽습니다. 시간 초과 시 TimeoutError, 종료 시 EOFError."""
+        fd = self._responses
+        while True:
+            if size is None:
+                newline = self._buffer.find(b"\n")
+                if newline >= 0:
+                    data = bytes(self._buffer[:newline])
+                    del self._buffer[:newline + 1]
+                    return data
+            elif len(self._buffer) >= size:
+                data = bytes(self._buffer[:size])
+                del self._buffer[:size]
+                return data
+            remaining = deadline - time.time()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise TimeoutError
+            # 큰 출력은 남은 길이만큼 크게 읽고, bytearray에 이어 붙여 매번 전체를 복사하지 않습니다.
+            missing = (size or 0) - len(self._buffer)
+            chunk = os.read(fd, min(max(missing, HARNESS_READ_SIZE), HARNESS_MAX_READ_SIZE))
+            if not chunk:
+                raise EOFError
+            self._buffer += chunk
+
+    def run(self, input_data, timeout=5):
+        """run_java_program과 같은 형식 (성공 여부, 출력, 실행 시간, 오류 메시지)으로 결과를 반환합니다."""
+        if self.disabled:
+            return run_java_program(self.code_dir, self.class_name, input_data, timeout)
+
+        start_time = time.time()
+        try:
+            if self.process is None:
+                self._start()
+            payload = input_data.encode('utf-8')
+            self._requests.write(f"{len(payload)} {int(timeout * 1000)}\n".encode('ascii') + payload)
+            self._requests.flush()
+
+            # 하네스가 제한 시간에 맞춰 보내는 TIMEOUT/RETRY 응답을 받을 수 있도록 조금 더 기다립니다.
+            deadline = time.time() + timeout + HARNESS_GRACE_SECONDS
+            status, length = self._read(None, deadline).decode('ascii').split()
+            if status in ("TIMEOUT", "RETRY"):
+                # 하네스는 이 응답을 보낸 뒤 스스로 종료하므로 다음 테스트에서 새로 띄우고,
+                # 이 테스트만 별도 JVM에서 다시 실행해 하네스 때문에 생긴 시간 초과가 아닌지 확인합니다.
+                self.close()
+                return run_java_program(self.code_dir, self.class_name, input_data, timeout)
+            body = self._read(int(length), deadline).decode('utf-8', errors='replace')
+        except TimeoutError:
+            # 응답하지 않는 하네스는 종료하고(다음 테스트에서 새로 띄움), 이 테스트는 별도 JVM에서 다시 실행합니다.
+            self.close()
+            return run_java_program(self.code_dir, self.class_name, input_data, timeout)
+        except (OSError, EOFError, ValueError):
+            # 하네스가 비정상 종료하면 이후 테스트는 기존 방식으로 실행합니다.
+            self.close()
+            self.disabled = True
+            return run_java_program(self.code_dir, self.class_name, input_data, timeout)
+
+        execution_time = time.time() - start_time
+        if status == "OK":
+            return True, body.strip(), execution_time, ""
+        return False, "", execution_time, body or "프로그램 실행 오류"
+
+    def close(self):
+        """하네스 프로세스를 종료합니다."""
+        if self.process is None:
+            return
+        try:
+            self.process.kill()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        try:
+            self._requests.close()
+        except OSError:
+            pass
+        os.close(self._responses)
+        self._requests = self._responses = None
+        self.process = None
+
 def normalize_output(output):
-    """출력을 정규화합니다."""
+    """출력을 정규화합니다. (전체와 각 줄의 앞뒤 공백 제거)"""
     if not output:
         return ""
-    lines = output.strip().split('\n')
-    normalized_lines = [line.strip() for line in lines]
-    return '\n'.join(normalized_lines)
+    return LINE_EDGE_WHITESPACE.sub('', output.strip())
+
+def problem_run_settings(problem_details):
+    """문제 정보로 실행 제한 시간과 실수 출력 허용 오차를 정합니다. (timeout, float_tolerance)를 반환합니다."""
+    timeout = DEFAULT_RUN_TIMEOUT
+    # Gemini가 제한사항을 dict/list로 돌려주는 경우도 있으므로 문자열로 바꿔서 찾습니다.
+    time_limit = TIME_LIMIT_PATTERN.search(str(problem_details.get('limits') or ''))
+    if time_limit:
+        try:
+            # 백준의 Java 시간 제한 규칙(×2+1초)을 따르되, JVM 시작 시간을 고려해 너무 짧거나 길지 않게 맞춥니다.
+            timeout = min(max(float(time_limit.group(1)) * 2 + 1, 2), MAX_RUN_TIMEOUT)
+        except ValueError:
+            timeout = DEFAULT_RUN_TIMEOUT
 
-def compare_outputs(expected, actual, problem_id=None):
-    """출력을 비교합니다."""
+    # 실수 출력 문제는 출력 형식이나 설명에 허용 오차가 적혀 있습니다.
+    float_tolerance = None
+    statement = f"{problem_details.get('output_format') or ''}\n{problem_details.get('description') or ''}"
+    tolerance = ERROR_TOLERANCE_PATTERN.search(statement)
+    if tolerance:
+        float_tolerance = 10 ** -int(tolerance.group(1) or tolerance.group(2))
+    return timeout, float_tolerance
+
+def is_real_token(token):
+    """소수점이나 지수 표기가 있는 실수 토큰인지 확인합니다."""
+    return '.' in token or 'e' in token or 'E' in token
+
+def compare_outputs(expected, actual, float_tolerance=None):
+    """출력을 비교합니다. float_tolerance가 있으면 실수 토큰은 허용 오차 안에서 같다고 봅니다."""
+    # 대부분의 정답은 앞뒤 공백만 정리하면 그대로 같으므로, 줄 단위 정규화 전에 먼저 비교합니다.
+    if expected.strip() == actual.strip():
+        return True
     expected_norm = normalize_output(expected)
     actual_norm = normalize_output(actual)
-    return expected_norm == actual_norm
+    if expected_norm == actual_norm or float_tolerance is None:
+        return expected_norm == actual_norm
+
+    expected_tokens, actual_tokens = expected_norm.split(), actual_norm.split()
+    if len(expected_tokens) != len(actual_tokens):
+        return False
+    for expected_token, actual_token in zip(expected_tokens, actual_tokens):
+        if expected_token == actual_token:
+            continue
+        # 정수 토큰은 정확히 같아야 하고, 실수 토큰("."/지수 표기 포함)만 허용 오차를 적용합니다.
+        if not (is_real_token(expected_token) or is_real_token(actual_token)):
+            return False
+        try:
+            # 백준 기준: 절대 오차 또는 상대 오차 중 하나라도 허용 범위 안이면 정답
+            if not math.isclose(float(expected_token), float(actual_token), rel_tol=float_tolerance, abs_tol=float_tolerance):
+                return False
+        except ValueError:
+            return False
+    return True
+
+def _verdict_cache_path(code_hash, input_data, expected_output, float_tolerance=None):
+    """코드 해시와 입력/예상 출력(및 허용 오차)으로 판정 캐시 파일 경로를 만듭니다."""
+    digest = hashlib.sha256()
+    for part in (str(VERDICT_CACHE_VERSION), code_hash, input_data, expected_output, str(float_tolerance)):
+        digest.update(part.encode('utf-8'))
+        digest.update(b"\0")
+    return VERDICT_CACHE_DIR / f"{digest.hexdigest()}.json"
 
-def run_single_test(code_dir, class_name, test_case, test_type, test_index, problem_id=None):
+def load_cached_verdict(code_hash, input_data, expected_output, float_tolerance=None):
+    """캐시된 판정이 있으면 반환하고, 없으면 None을 반환합니다."""
+    if not code_hash or os.getenv("BOJ_CACHE_DISABLE"):
+        return None
+    try:
+        with open(_verdict_cache_path(code_hash, input_data, expected_output, float_tolerance), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_verdict(code_hash, result_detail, float_tolerance=None):
+    """판정 결과를 캐시에 저장합니다. 저장 실패는 무시합니다."""
+    if not code_hash or os.getenv("BOJ_CACHE_DISABLE"):
+        return
+    path = _verdict_cache_path(code_hash, result_detail['input'], result_detail['expected'], float_tolerance)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(result_detail, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"     ⚠️ 판정 캐시 저장 실패: {e}")
+
+def truncate_repr(value, limit=LOG_REPR_LIMIT):
+    """로그용 repr을 limit자까지만 남깁니다."""
+    text = repr(value)
+    if DEBUG_MODE or len(text) <= limit:
+        return text
+    return f"{text[:limit]}...<{len(text) - limit}자 생략>"
+
+def run_single_test(code_dir, class_name, test_case, test_type, test_index, problem_id=None, code_hash=None, harness=None,
+                    timeout=DEFAULT_RUN_TIMEOUT, float_tolerance=None):
     """단일 테스트케이스를 실행합니다."""
     input_data = test_case.get('input', '')
     expected_output = test_case.get('output', '')
     description = test_case.get('description', f'{test_type} 테스트 {test_index + 1}')
     
     print(f"  🧪 {description}")
-    print(f"     입력: {repr(input_data)}")
-    print(f"     예상: {repr(expected_output)}")
+    print(f"     입력: {truncate_repr(input_data)}")
+    print(f"     예상: {truncate_repr(expected_output)}")
     
+    # 같은 코드로 같은 테스트케이스를 이미 실행했다면 JVM을 다시 띄우지 않습니다.
+    cached = load_cached_verdict(code_hash, input_data, expected_output, float_tolerance)
+    if cached:
+        cached['description'] = description
+        print(f"     📦 캐시된 결과: {'✅ 통과' if cached['passed'] else '❌ 실패 - ' + (cached.get('error') or '출력 불일치')}")
+        return cached
+
     # ✨ [수정] 코드 디렉토리를 run_java_program에 전달
-    success, actual_output, exec_time, error_msg = run_java_program(code_dir, class_name, input_data)
+    if harness:
+        success, actual_output, exec_time, error_msg = harness.run(input_data, timeout)
+    else:
+        success, actual_output, exec_time, error_msg = run_java_program(code_dir, class_name, input_data, timeout)
     
     result_detail = {
         'input': input_data, 'expected': expected_output, 
@@ -113,23 +447,40 @@ def run_single_test(code_dir, class_name, test_case, test_type, test_index, prob
         result_detail['passed'] = False
         return result_detail
     
-    print(f"     실제: {repr(actual_output)}")
+    print(f"     실제: {truncate_repr(actual_output)}")
     print(f"     시간: {exec_time:.3f}초")
     
-    if compare_outputs(expected_output, actual_output, problem_id):
+    if compare_outputs(expected_output, actual_output, float_tolerance):
         print(f"     ✅ 통과")
         result_detail['passed'] = True
     else:
         print(f"     ❌ 실패 - 출력 불일치")
         result_detail['passed'] = False
         result_detail['error'] = '출력 불일치'
-        
+
+    # 정상 종료한 실행의 판정만 저장합니다. (시간 초과 등 실행 실패는 환경에 따라 달라질 수 있음)
+    save_verdict(code_hash, result_detail, float_tolerance)
     return result_detail
 
-def run_test_suite(code_dir, class_name, test_cases, test_type, problem_id=None):
-    """테스트 스위트를 실행합니다."""
+def dedupe_test_cases(test_cases, known_cases=()):
+    """입력과 예상 출력이 같은 테스트케이스는 처음 것만 남깁니다. known_cases와 겹치는 케이스도 제외합니다."""
+    def case_key(test_case):
+        return str(test_case.get('input', '')).strip(), normalize_output(str(test_case.get('output', '')))
+
+    seen = {case_key(test_case) for test_case in known_cases}
+    unique_cases = []
+    for test_case in test_cases:
+        key = case_key(test_case)
+        if key not in seen:
+            seen.add(key)
+            unique_cases.append(test_case)
+    return unique_cases
+
+def run_test_suite(code_dir, class_name, test_cases, test_type, problem_id=None, code_hash=None, harness=None,
+                   fail_fast_after=FAIL_FAST_AFTER, timeout=DEFAULT_RUN_TIMEOUT, float_tolerance=None):
+    """테스트 스위트를 실행합니다. fail_fast_after번 실패하면 남은 테스트는 건너뜁니다."""
     print(f"\n📋 {test_type} 테스트 실행 ({len(test_cases)}개)")
-    results = {'total': len(test_cases), 'passed': 0, 'failed': 0, 'details': []}
+    results = {'total': len(test_cases), 'passed': 0, 'failed': 0, 'skipped': 0, 'details': empty_details()}
     
     if not test_cases:
         print(f"  ⚠️ {test_type} 테스트케이스가 없습니다.")
@@ -137,28 +488,24 @@ def run_test_suite(code_dir, class_name, test_cases, test_type, problem_id=None)
     
     for i, test_case in enumerate(test_cases):
         # ✨ [수정] 코드 디렉토리를 run_single_test에 전달
-        test_result = run_single_test(code_dir, class_name, test_case, test_type, i, problem_id)
-        results['details'].append(test_result)
+        test_result = run_single_test(code_dir, class_name, test_case, test_type, i, problem_id, code_hash, harness,
+                                      timeout, float_tolerance)
+        for field in DETAIL_FIELDS:
+            results['details'][field].append(test_result.get(field))
         if test_result['passed']:
             results['passed'] += 1
         else:
             results['failed'] += 1
+            if fail_fast_after and results['failed'] >= fail_fast_after:
+                results['skipped'] = len(test_cases) - i - 1
+                if results['skipped']:
+                    print(f"  ⏭️ {results['failed']}개 실패로 남은 {results['skipped']}개 테스트를 건너뜁니다.")
+                break
             
     print(f"📊 {test_type} 테스트 결과: {results['passed']}/{results['total']} 통과")
     return results
 
-def load_test_cases(file_path):
-    """테스트케이스 파일을 로드합니다."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data.get('test_cases', [])
-    except FileNotFoundError:
-        print(f"⚠️ 테스트 파일 없음: {file_path}")
-    except Exception as e:
-        print(f"❌ 테스트 파일 로드 실패 ({file_path}): {e}")
-    return []
-
+@lru_cache(maxsize=1)
 def load_problems_info():
     """PR에서 추출된 문제 정보를 로드합니다."""
     try:
@@ -170,59 +517,48 @@ def load_problems_info():
         print(f"❌ 문제 정보 로드 실패: {e}")
     return []
 
+# 이번 실행에서 수집에 성공한 문제 정보 (같은 문제의 다른 제출은 다시 수집하지 않음)
+_fetch_cache = {}
+
 def search_problem_with_fetch_boj(problem_id):
-    """fetch_boj_problem.py를 사용하여 문제를 검색합니다."""
-    print(f"🔍 fetch_boj_problem.py로 문제 {problem_id} 검색 중...")
+    """fetch_boj_problem 모듈로 문제를 검색합니다. (문제 정보, 오류 메시지)를 반환합니다."""
+    if problem_id in _fetch_cache:
+        print(f"📦 문제 {problem_id} 정보를 재사용합니다.")
+        return _fetch_cache[problem_id], ""
+    
+    print(f"🔍 fetch_boj_problem으로 문제 {problem_id} 검색 중...")
     try:
-        # ✨ [수정] 타임아웃을 180초로 늘려 안정성 확보
-        result = subprocess.run([
-            'python', 'scripts/fetch_boj_problem.py',
-            '--problem-id', problem_id,
-            '--output', f'problem_{problem_id}_info.json'
-        ], capture_output=True, text=True, timeout=180)
-        
-        if result.returncode == 0:
+        problem_details, _ = fetch_boj_problem.collect_problem_info(problem_id)
+        if problem_details:
             print(f"✅ 문제 {problem_id} 검색 성공")
-            return True, ""
-        else:
-            error_msg = result.stderr or result.stdout or "알 수 없는 검색 실패"
-            print(f"⚠️ 문제 {problem_id} 검색 실패: {error_msg.strip()}")
-            return False, error_msg.strip()
-    except subprocess.TimeoutExpired:
-        print(f"⚠️ 문제 {problem_id} 검색 시간 초과 (180초)")
-        return False, "검색 시간 초과"
+            _fetch_cache[problem_id] = problem_details
+            return problem_details, ""
+        print(f"⚠️ 문제 {problem_id} 검색 실패")
+        return None, "문제 정보 수집 실패"
     except Exception as e:
         print(f"⚠️ 문제 {problem_id} 검색 중 오류: {e}")
-        return False, str(e)
+        return None, str(e)
 
-def generate_tests_with_gemini(problem_info):
-    """Gemini API를 사용하여 테스트케이스를 생성합니다."""
+def generate_tests_with_gemini(problem_info, problem_details):
+    """Gemini API를 사용하여 테스트케이스를 생성합니다. (테스트케이스 목록, 오류 메시지)를 반환합니다."""
     problem_id = problem_info['problem_id']
     code_file = problem_info['code_file']
     language = problem_info.get('language', 'java')
     
     print(f"🤖 Gemini로 문제 {problem_id} 테스트케이스 생성 중...")
     try:
-        result = subprocess.run([
-            'python', 'scripts/gemini_test_generator.py',
-            '--problem-id', problem_id, '--code-file', code_file,
-            '--language', language, '--problem-info', f'problem_{problem_id}_info.json',
-            '--output', f'tests_{problem_id}.json'
-        ], capture_output=True, text=True, timeout=180)
+        with open(code_file, 'r', encoding='utf-8') as f:
+            code_content = f.read()
+        generated = gemini_test_generator.generate_tests(problem_id, problem_details, code_content, language)
         
-        if result.returncode == 0:
+        if generated is not None:
             print(f"✅ 문제 {problem_id} 테스트케이스 생성 성공")
-            return True, ""
-        else:
-            error_msg = result.stderr or result.stdout or "테스트 생성 실패"
-            print(f"⚠️ 문제 {problem_id} 테스트케이스 생성 실패: {error_msg.strip()}")
-            return False, error_msg.strip()
-    except subprocess.TimeoutExpired:
-        print(f"⚠️ 문제 {problem_id} 테스트 생성 시간 초과")
-        return False, "테스트 생성 시간 초과"
+            return generated['test_cases'], ""
+        print(f"⚠️ 문제 {problem_id} 테스트케이스 생성 실패")
+        return [], "테스트 생성 실패"
     except Exception as e:
         print(f"⚠️ 문제 {problem_id} 테스트 생성 중 오류: {e}")
-        return False, str(e)
+        return [], str(e)
 
 def run_single_problem_test(problem_info):
     """단일 문제에 대한 전체 테스트를 실행합니다."""
@@ -249,43 +585,68 @@ def run_single_problem_test(problem_info):
             result['result'] = 'ERROR'
             return result
 
-        compilation_success, compilation_error = compile_java_code(code_file)
-        if not compilation_success:
-            result['errors'].append(f"컴파일 실패: {compilation_error}")
-            result['result'] = 'COMPILATION_ERROR'
-            return result
-        
-        # ✨ [수정] Java 클래스 경로와 이름을 올바르게 설정
+        # ✨ [수정] Java 클래스 경로와 이름을 올바르게 설정 (클래스 파일은 임시 디렉토리에서 실행)
         code_path = Path(code_file)
-        code_dir = str(code_path.parent)
+        code_dir = tempfile.mkdtemp(prefix="boj-classes-", dir=CLASS_DIR_ROOT)
         class_name = code_path.stem
+        code_hash = hashlib.sha256(code_path.read_bytes()).hexdigest()
         
         try:
+            # 문제 검색(네트워크 대기)은 컴파일과 독립적이므로, javac가 도는 동안 이 스레드에서 검색합니다.
+            # (별도 스레드를 두지 않으므로 컴파일에 실패해도 끝나지 않은 작업이 남지 않음)
+            compile_process, compile_start_error = start_java_compile(code_file, code_dir)
+            try:
+                problem_details, search_error = search_problem_with_fetch_boj(problem_id)
+            finally:
+                compilation_success, compilation_error = wait_java_compile(compile_process, compile_start_error)
+            if not compilation_success:
+                result['errors'].append(f"컴파일 실패: {compilation_error}")
+                result['result'] = 'COMPILATION_ERROR'
+                return result
+
             # ✨ [수정] 검색 실패 시 대안 처리 로직 제거, 실패 시 즉시 에러로 반환
-            search_success, search_error = search_problem_with_fetch_boj(problem_id)
-            result['search_success'] = search_success
-            if not search_success:
+            result['search_success'] = problem_details is not None
+            if problem_details is None:
                 result['errors'].append(f"문제 검색 실패: {search_error}")
                 result['result'] = 'ERROR'
                 return result
 
-            test_gen_success, test_gen_error = generate_tests_with_gemini(problem_info)
-            if not test_gen_success:
+            generated_test_cases, test_gen_error = generate_tests_with_gemini(problem_info, problem_details)
+            if test_gen_error:
                 result['errors'].append(f"테스트 생성 실패: {test_gen_error}")
                 # 테스트 생성 실패는 치명적이지 않으므로 계속 진행 (샘플 테스트는 가능)
             
-            sample_tests_path = f'sample_{problem_id}_tests.json'
-            generated_tests_path = f'tests_{problem_id}.json'
-            
-            sample_test_cases = load_test_cases(sample_tests_path)
-            generated_test_cases = load_test_cases(generated_tests_path)
+            sample_test_cases = problem_details.get('samples', [])
+            # Gemini가 같은 케이스를 반복하거나 예제를 그대로 다시 내놓는 경우 한 번만 실행합니다.
+            unique_generated = dedupe_test_cases(generated_test_cases, sample_test_cases)
+            if len(unique_generated) < len(generated_test_cases):
+                print(f"♻️ 중복된 생성 테스트케이스 {len(generated_test_cases) - len(unique_generated)}개를 제외합니다.")
+                generated_test_cases = unique_generated
+            timeout, float_tolerance = problem_run_settings(problem_details)
             
             print(f"📋 로드된 테스트케이스: 샘플 {len(sample_test_cases)}개, 생성 {len(generated_test_cases)}개")
+            print(f"⏱️ 실행 제한 시간: {timeout:g}초" + (f", 실수 허용 오차: {float_tolerance:g}" if float_tolerance else ""))
             
             # ✨ [수정] 테스트 실행 함수에 코드 디렉토리 전달
             test_result_obj = TestResult()
-            test_result_obj.sample_tests = run_test_suite(code_dir, class_name, sample_test_cases, "샘플", problem_id)
-            test_result_obj.generated_tests = run_test_suite(code_dir, class_name, generated_test_cases, "생성", problem_id)
+            # 한 문제의 모든 테스트케이스를 하나의 JVM에서 실행합니다.
+            harness = JavaHarness(code_dir, class_name, code_path.read_text(encoding='utf-8', errors='replace'))
+            try:
+                test_result_obj.sample_tests = run_test_suite(code_dir, class_name, sample_test_cases, "샘플", problem_id, code_hash, harness,
+                                                              timeout=timeout, float_tolerance=float_tolerance)
+                sample_results = test_result_obj.sample_tests
+                if generated_test_cases and sample_results['failed'] > 0 and sample_results['passed'] > 0:
+                    # 샘플이 일부만 통과하면 생성 테스트 결과와 관계없이 부분 성공이므로 생성 테스트는 건너뜁니다.
+                    print(f"\n⏭️ 샘플 테스트 실패로 생성 테스트 {len(generated_test_cases)}개를 건너뜁니다.")
+                    test_result_obj.generated_tests = {
+                        'total': len(generated_test_cases), 'passed': 0, 'failed': 0,
+                        'skipped': len(generated_test_cases), 'details': empty_details()
+                    }
+                else:
+                    test_result_obj.generated_tests = run_test_suite(code_dir, class_name, generated_test_cases, "생성", problem_id, code_hash, harness,
+                                                                     timeout=timeout, float_tolerance=float_tolerance)
+            finally:
+                harness.close()
             
             s_total, s_passed = test_result_obj.sample_tests['total'], test_result_obj.sample_tests['passed']
             g_total, g_passed = test_result_obj.generated_tests['total'], test_result_obj.generated_tests['passed']
@@ -308,10 +669,8 @@ def run_single_problem_test(problem_info):
             print(f"📊 문제 {problem_id} 최종 결과: {result['result']}")
             
         finally:
-            class_file = Path(code_file).with_suffix('.class')
-            if class_file.exists():
-                class_file.unlink()
-                print(f"🧹 정리 완료: {class_file}")
+            shutil.rmtree(code_dir, ignore_errors=True)
+            print(f"🧹 정리 완료: {code_dir}")
     
     except Exception as e:
         result['errors'].append(f"실행 중 치명적 오류: {str(e)}")
@@ -321,6 +680,56 @@ def run_single_problem_test(problem_info):
         
     return result
 
+def run_problem_safely(problem):
+    """단일 문제를 테스트하고, 예상치 못한 오류도 결과로 변환합니다."""
+    try:
+        return run_single_problem_test(problem)
+    except Exception as e:
+        print(f"❌ 문제 {problem.get('problem_id', 'unknown')} 처리 중 최상위 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return {
+            'problem_id': problem.get('problem_id', 'unknown'),
+            'author': problem.get('author', 'unknown'),
+            'result': 'ERROR', 'errors': [str(e)]
+        }
+
+# 동시에 테스트하는 문제들의 로그가 한 줄씩 섞이지 않도록, 문제별 작업의 출력은 버퍼에 모았다가 한꺼번에 출력합니다.
+_log_buffer = contextvars.ContextVar("log_buffer", default=None)
+
+class ProblemLogStream:
+    """문제별 작업에서 출력한 내용은 그 작업의 로그 버퍼에, 그 밖의 출력은 원래 스트림에 씁니다."""
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text):
+        buffer = _log_buffer.get()
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def flush(self):
+        if _log_buffer.get() is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def run_problem_group(problems):
+    """같은 문제 번호의 제출들을 순서대로 테스트합니다. (결과 목록, 테스트 중 출력한 로그)를 반환합니다."""
+    buffer = io.StringIO()
+    token = _log_buffer.set(buffer)
+    try:
+        return [run_problem_safely(problem) for problem in problems], buffer.getvalue()
+    finally:
+        _log_buffer.reset(token)
+
+def strip_test_details(problem_result):
+    """테스트케이스별 상세(입력/출력 등)를 뺀 문제 결과를 반환합니다. 요약에는 개수만 필요합니다."""
+    light_result = dict(problem_result)
+    for key in ('sample_tests', 'generated_tests'):
+        if key in light_result:
+            light_result[key] = {k: v for k, v in light_result[key].items() if k != 'details'}
+    return light_result
+
 # generate_summary와 main 함수는 기존 코드와 동일하게 사용합니다.
 def generate_summary(results):
     """테스트 결과 요약을 생성합니다."""
@@ -352,20 +761,39 @@ def main():
     for p in problems:
         print(f"  - 문제 {p['problem_id']} ({p['author']}) - {p['code_file']}")
     
-    results = []
-    for i, problem in enumerate(problems, 1):
-        print(f"\n🔄 진행률: {i}/{len(problems)}")
-        try:
-            results.append(run_single_problem_test(problem))
-        except Exception as e:
-            print(f"❌ 문제 {problem.get('problem_id', 'unknown')} 처리 중 최상위 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append({
-                'problem_id': problem.get('problem_id', 'unknown'),
-                'author': problem.get('author', 'unknown'),
-                'result': 'ERROR', 'errors': [str(e)]
-            })
+    # 문제끼리는 서로 독립적이므로 동시에 테스트합니다. 단, 같은 문제 번호의 제출은
+    # 한 작업에서 순서대로 처리하여 먼저 수집한 문제 정보 캐시를 재사용합니다.
+    groups = {}
+    for index, problem in enumerate(problems):
+        groups.setdefault(problem.get('problem_id'), []).append((index, problem))
+
+    results = [None] * len(problems)
+    max_workers = min(len(groups), os.cpu_count() or 1)
+    print(f"⚡ 최대 {max_workers}개 작업을 동시에 실행합니다.")
+    # 테스트케이스별 상세는 끝나는 대로 파일에 기록하고, 메모리에는 요약에 필요한 개수만 남깁니다.
+    # 문제별 로그는 작업이 끝난 뒤 문제 순서대로 한꺼번에 출력합니다. (표준 오류로 출력한 스택 트레이스 등도 같은 로그에 모음)
+    original_stdout, original_stderr = sys.stdout, sys.stderr
+    sys.stdout = ProblemLogStream(original_stdout)
+    sys.stderr = ProblemLogStream(original_stderr)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                open(RESULTS_LOG_PATH, 'w', encoding='utf-8') as results_log:
+            futures = [
+                (group, executor.submit(run_problem_group, [problem for _, problem in group]))
+                for group in groups.values()
+            ]
+            completed = 0
+            for group, future in futures:
+                group_results, log = future.result()
+                print(log, end='', flush=True)
+                for (index, _), problem_result in zip(group, group_results):
+                    results_log.write(json.dumps(problem_result, ensure_ascii=False) + '\n')
+                    results_log.flush()
+                    results[index] = strip_test_details(problem_result)
+                    completed += 1
+                    print(f"\n🔄 진행률: {completed}/{len(problems)}")
+    finally:
+        sys.stdout, sys.stderr = original_stdout, original_stderr
     
     summary = generate_summary(results)
     with open('test_results_summary.json', 'w', encoding='utf-8') as f:
@@ -392,11 +820,13 @@ def main():
             print(f"      └─ {res['errors'][0]}")
     
     if 'GITHUB_OUTPUT' in os.environ:
+        output_lines = [
+            f"{key}={str(value).lower() if isinstance(value, bool) else value}\n"
+            for key, value in summary.items() if isinstance(value, (int, bool))
+        ]
+        output_lines.append(f"overall_result={'PASS' if summary['overall_success'] else 'FAIL'}\n")
         with open(os.environ['GITHUB_OUTPUT'], 'a', encoding='utf-8') as f:
-            for key, value in summary.items():
-                if isinstance(value, (int, bool)):
-                    f.write(f"{key}={str(value).lower() if isinstance(value, bool) else value}\n")
-            f.write(f"overall_result={'PASS' if summary['overall_success'] else 'FAIL'}\n")
+            f.write(''.join(output_lines))
 
     exit_code = 0 if summary['overall_success'] else 1
     print(f"\n🏁 테스트 완료 (종료 코드: {exit_code})")
@@ -1,9 +1,11 @@
 import json
-import subprocess
 import os
-import tempfile
 import sys
 
+from webhook_session import WEBHOOK_TIMEOUT, create_webhook_session
+
+SESSION = create_webhook_session()
+
 try:
     with open("test_results_summary.json", "r", encoding="utf-8") as f:
         results = json.load(f)
@@ -90,30 +92,8 @@ try:
         print("❌ 사용 가능한 개인 웹훅 URL이 없습니다.")
         sys.exit(0)
 
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".json", delete=False, encoding="utf-8"
-    ) as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
-        payload_file = f.name
-
-    subprocess.run(
-        [
-            "curl",
-            "-X",
-            "POST",
-            "-H",
-            "Content-Type: application/json",
-            "-d",
-            f"@{payload_file}",
-            webhook_url,
-            "--fail",
-            "--silent",
-            "--show-error",
-        ],
-        check=True,
-    )
-
-    os.unlink(payload_file)
+    response = SESSION.post(webhook_url, json=payload, timeout=WEBHOOK_TIMEOUT)
+    response.raise_for_status()
     print("✅ 실패 알림 전송 완료")
 
 except Exception as e:
@@ -9,6 +9,10 @@ import json
 from datetime import datetime
 import pytz
 
+from webhook_session import WEBHOOK_TIMEOUT, create_webhook_session
+
+SESSION = create_webhook_session()
+
 def send_merge_notification(pr_url, user, week_number, webhook_url):
     """머지 완료 알림 전송"""
     
@@ -88,11 +92,11 @@ def send_merge_notification(pr_url, user, week_number, webhook_url):
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             webhook_url,
             json=message,
             headers={'Content-Type': 'application/json'},
-            timeout=10
+            timeout=WEBHOOK_TIMEOUT
         )
         
         if response.status_code == 200:
@@ -1,9 +1,11 @@
 import json
-import subprocess
 import os
-import tempfile
 import sys
 
+from webhook_session import WEBHOOK_TIMEOUT, create_webhook_session
+
+SESSION = create_webhook_session()
+
 try:
     with open('test_results_summary.json', 'r', encoding='utf-8') as f:
         results = json.load(f)
@@ -129,19 +131,8 @@ try:
     print(message)
     print('=' * 50)
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
-        payload_file = f.name
-    
-    subprocess.run([
-        'curl', '-X', 'POST',
-        '-H', 'Content-Type: application/json',
-        '-d', f'@{payload_file}',
-        webhook_url,
-        '--fail', '--silent', '--show-error'
-    ], check=True)
-    
-    os.unlink(payload_file)
+    response = SESSION.post(webhook_url, json=payload, timeout=WEBHOOK_TIMEOUT)
+    response.raise_for_status()
     print('✅ 성공 알림 전송 완료')
     
 except Exception as e:
@@ -6,7 +6,9 @@ scripts/session_counter.py
 
 import json
 import os
+import shutil
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 import pytz
 
@@ -68,10 +70,7 @@ def save_session_info(session_info):
         # 백업 파일 생성 (기존 파일이 있는 경우)
         if os.path.exists(SESSION_FILE):
             backup_file = f"{SESSION_FILE}.backup"
-            with open(SESSION_FILE, "r", encoding="utf-8") as f:
-                backup_data = f.read()
-            with open(backup_file, "w", encoding="utf-8") as f:
-                f.write(backup_data)
+            shutil.copyfile(SESSION_FILE, backup_file)
 
         with open(SESSION_FILE, "w", encoding="utf-8") as f:
             json.dump(session_info, f, ensure_ascii=False, indent=2)
@@ -102,8 +101,11 @@ def get_current_week_info():
     }
 
 
-def get_week_info_for_date(date_str):
-    """특정 날짜의 주차 정보 계산 (일요일 기준)"""
+# 배치 업데이트에서는 같은 제출 날짜가 반복되므로, 날짜별 주차 계산 결과를 재사용합니다.
+# (회차 파일 갱신은 get_session_info에서 매번 하도록 계산 부분만 캐시)
+@lru_cache(maxsize=64)
+def _week_range_for_date(date_str):
+    """특정 날짜가 속한 주의 (월요일, 일요일) 문자열을 계산합니다."""
     try:
         target_date = datetime.strptime(date_str, "%Y-%m-%d")
     except ValueError as e:
@@ -120,10 +122,16 @@ def get_week_info_for_date(date_str):
     # 해당 주 월요일 계산
     current_monday = current_sunday - timedelta(days=6)
 
+    return current_monday.strftime("%Y-%m-%d"), current_sunday.strftime("%Y-%m-%d")
+
+
+def get_week_info_for_date(date_str):
+    """특정 날짜의 주차 정보 계산 (일요일 기준)"""
+    monday, sunday = _week_range_for_date(date_str)
     return {
-        "monday": current_monday.strftime("%Y-%m-%d"),
-        "sunday": current_sunday.strftime("%Y-%m-%d"),
-        "deadline": current_sunday.strftime("%Y-%m-%d 23:59"),
+        "monday": monday,
+        "sunday": sunday,
+        "deadline": f"{sunday} 23:59",
     }
 
 
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+test_circuit_breaker.py
+deadline_checker.py의 웹훅 호스트별 CircuitBreaker를 테스트합니다.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# test 디렉토리의 상위(scripts) 디렉토리 모듈을 import 할 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deadline_checker import CircuitBreaker
+
+HOST = "chat.example.com"
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """연속 실패한 호스트 차단 테스트"""
+
+    def setUp(self):
+        """시간을 직접 움직일 수 있도록 time.monotonic을 대신합니다."""
+        self.now = 1000.0
+        patcher = patch("deadline_checker.time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=300)
+
+    def fail(self, times, host=HOST):
+        for _ in range(times):
+            self.breaker.record_failure(host)
+
+    def test_opens_after_threshold(self):
+        """기준 횟수만큼 연속 실패하기 전까지는 요청을 보냅니다."""
+        self.fail(2)
+        self.assertTrue(self.breaker.allow(HOST))
+        self.fail(1)
+        self.assertFalse(self.breaker.allow(HOST))
+
+    def test_success_resets_failures(self):
+        """성공하면 연속 실패 횟수를 처음부터 다시 셉니다."""
+        self.fail(2)
+        self.breaker.record_success(HOST)
+        self.fail(2)
+        self.assertTrue(self.breaker.allow(HOST))
+
+    def test_hosts_are_independent(self):
+        """한 호스트의 실패가 다른 호스트를 막지 않습니다."""
+        self.fail(3)
+        self.assertFalse(self.breaker.allow(HOST))
+        self.assertTrue(self.breaker.allow("other.example.com"))
+
+    def test_half_open_allows_single_trial(self):
+        """recovery_timeout이 지나면 시험 요청 하나만 보냅니다."""
+        self.fail(3)
+        self.now += 299
+        self.assertFalse(self.breaker.allow(HOST))
+        self.now += 1
+        self.assertTrue(self.breaker.allow(HOST))
+        self.assertFalse(self.breaker.allow(HOST))
+
+    def test_trial_result(self):
+        """시험 요청이 성공하면 닫히고, 실패하면 다시 recovery_timeout 동안 막습니다."""
+        self.fail(3)
+        self.now += 300
+        self.assertTrue(self.breaker.allow(HOST))
+        self.fail(1)
+        self.now += 299
+        self.assertFalse(self.breaker.allow(HOST))
+        self.now += 1
+        self.assertTrue(self.breaker.allow(HOST))
+        self.breaker.record_success(HOST)
+        self.assertTrue(self.breaker.allow(HOST))
+        self.assertTrue(self.breaker.allow(HOST))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+test_fetch_boj_problem.py
+fetch_boj_problem.py의 백준 HTML 파싱, Gemini 응답 JSON 추출, 문제 정보 캐시를 테스트합니다.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# test 디렉토리의 상위(scripts) 디렉토리 모듈을 import 할 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fetch_boj_problem
+from fetch_boj_problem import BeautifulSoup, collect_problem_info, extract_problem_info_from_html, find_json_object
+
+# 백준 문제 페이지에서 필요한 부분만 남긴 예시 HTML
+PROBLEM_HTML = """
+<html><head>
+<script>var limit = "<div id='problem_description'>가짜</div>";</script>
+<style>#problem_description { color: red; }</style>
+</head><body>
+<table id="problem-info">
+  <thead><tr><th>시간 제한</th><th>메모리 제한</th><th>제출</th></tr></thead>
+  <tbody><tr><td>2 초</td><td>128 MB</td><td>100</td></tr></tbody>
+</table>
+<div id="problem_description"><p>두 정수 A와 B를 입력받은 다음, A+B를 출력하는 프로그램을 작성하시오.</p></div>
+<div id="problem_input"><p>첫째 줄에 A와 B가 주어진다.</p></div>
+<div id="problem_output"><p>첫째 줄에 A+B를 출력한다.</p></div>
+<div id="problem_hint"></div>
+<pre id="sample-input-1">1 2
+</pre>
+<pre id="sample-output-1">3
+</pre>
+<pre id="sample-input-2">3 4</pre>
+<pre id="sample-output-2">7</pre>
+<pre id="sample-input-3">5 6</pre>
+</body></html>
+"""
+
+
+@unittest.skipIf(BeautifulSoup is None, "beautifulsoup4가 설치되어 있지 않습니다.")
+class TestExtractProblemInfoFromHtml(unittest.TestCase):
+    """백준 HTML 파싱 테스트"""
+
+    def test_extracts_fields_limits_and_samples(self):
+        """본문 필드, 제한사항, 짝이 맞는 예제만 추출합니다."""
+        info = extract_problem_info_from_html(PROBLEM_HTML)
+        self.assertEqual(info['description'], "두 정수 A와 B를 입력받은 다음, A+B를 출력하는 프로그램을 작성하시오.")
+        self.assertEqual(info['input_format'], "첫째 줄에 A와 B가 주어진다.")
+        self.assertEqual(info['output_format'], "첫째 줄에 A+B를 출력한다.")
+        self.assertEqual(info['limits'], "시간 제한: 2 초\n메모리 제한: 128 MB")
+        self.assertEqual(info['samples'], [
+            {'input': '1 2', 'output': '3'},
+            {'input': '3 4', 'output': '7'},
+        ])
+
+    def test_empty_fields_are_omitted(self):
+        """값이 없는 필드는 결과에 넣지 않습니다."""
+        self.assertNotIn('hint', extract_problem_info_from_html(PROBLEM_HTML))
+
+    def test_error_page(self):
+        """존재하지 않는 문제 페이지는 None을 반환합니다."""
+        self.assertIsNone(extract_problem_info_from_html("<html><body>존재하지 않는 문제</body></html>"))
+
+    def test_page_without_problem(self):
+        """본문과 예제가 모두 없으면 None을 반환합니다."""
+        self.assertIsNone(extract_problem_info_from_html("<html><body><div id='other'>x</div></body></html>"))
+
+
+class TestFindJsonObject(unittest.TestCase):
+    """응답 텍스트에서 JSON 객체 추출 테스트"""
+
+    def test_object_surrounded_by_text(self):
+        """앞뒤 설명 문장을 제외한 JSON 객체만 반환합니다."""
+        text = '결과입니다.\n{"title": "A+B", "samples": [{"input": "1 2"}]}\n이상입니다. {"other": 1}'
+        self.assertEqual(json.loads(find_json_object(text)), {"title": "A+B", "samples": [{"input": "1 2"}]})
+
+    def test_braces_and_quotes_inside_strings(self):
+        """문자열 안의 중괄호와 이스케이프된 따옴표는 짝 맞추기에 세지 않습니다."""
+        text = '{"code": "int main() { return 0; }", "quote": "\\"}\\""} 끝'
+        self.assertEqual(json.loads(find_json_object(text)), {"code": "int main() { return 0; }", "quote": '"}"'})
+
+    def test_incomplete_or_missing(self):
+        """완결되지 않았거나 객체가 없으면 None을 반환합니다."""
+        self.assertIsNone(find_json_object('{"title": "A+B", "samples": ['))
+        self.assertIsNone(find_json_object("JSON이 없습니다."))
+
+
+
+class TestProblemCacheTtl(unittest.TestCase):
+    """조합된 문제 정보 캐시의 유효 기간 테스트"""
+
+    def setUp(self):
+        cache_dir = tempfile.mkdtemp(prefix="boj_cache_test_")
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        patcher = patch.object(fetch_boj_problem, "CACHE_DIR", Path(cache_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # 2시간 전에 저장한 문제 정보
+        fetch_boj_problem.write_cache("problem", "1000", {"info": {"title": "캐시"}, "source": "cache"})
+        path = fetch_boj_problem._cache_path("problem", "1000")
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        entry["fetched_at"] = time.time() - 2 * 60 * 60
+        path.write_text(json.dumps(entry), encoding="utf-8")
+
+    def collect(self):
+        with patch.object(fetch_boj_problem, "get_solved_ac_info", return_value={"level": "N/A"}), \
+                patch.object(fetch_boj_problem, "get_boj_problem_details", return_value=({"title": "새로 조회"}, "html")):
+            return collect_problem_info("1000")
+
+    def test_cached_within_a_day(self):
+        """기본 설정에서는 하루 안에 저장한 문제 정보를 재사용합니다."""
+        self.assertEqual(self.collect(), ({"title": "캐시"}, "cache"))
+
+    def test_shorter_cache_ttl_days(self):
+        """--cache-ttl-days가 하루보다 짧으면 그 기간이 지난 문제 정보는 다시 조회합니다."""
+        with patch.object(fetch_boj_problem, "CACHE_TTL_SECONDS", 60 * 60):
+            info, source = self.collect()
+        self.assertEqual((info["title"], source), ("새로 조회", "html"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+test_java_harness.py
+multi_test_runner.py의 JavaHarness(하나의 JVM에서 테스트케이스를 반복 실행하는 하네스)를 테스트합니다.
+java/javac가 없는 환경에서는 건너뜁니다.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# test 디렉토리의 상위(scripts) 디렉토리 모듈을 import 할 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import multi_test_runner
+from multi_test_runner import JavaHarness, start_java_compile, wait_java_compile
+
+JAVA_AVAILABLE = shutil.which("java") is not None and shutil.which("javac") is not None
+
+SUM_SOURCE = """
+import java.util.Scanner;
+
+public class Main {
+    public static void main(String[] args) {
+        Scanner sc = new Scanner(System.in);
+        System.out.println(sc.nextInt() + sc.nextInt());
+    }
+}
+"""
+
+# 입력이 "loop"이면 끝나지 않습니다.
+LOOP_SOURCE = """
+import java.util.Scanner;
+
+public class Main {
+    public static void main(String[] args) {
+        String command = new Scanner(System.in).next();
+        while (command.equals("loop")) {
+            Thread.onSpinWait();
+        }
+        System.out.println("done");
+    }
+}
+"""
+
+
+@unittest.skipUnless(JAVA_AVAILABLE, "java/javac가 설치되어 있지 않습니다.")
+class TestJavaHarness(unittest.TestCase):
+    """JavaHarness 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="java_harness_test_")
+        self.addCleanup(shutil.rmtree, self.work_dir, ignore_errors=True)
+
+    def compile(self, source):
+        """Main.java를 컴파일하고 클래스 디렉토리를 반환합니다."""
+        source_file = Path(self.work_dir) / "Main.java"
+        source_file.write_text(source, encoding="utf-8")
+        class_dir = tempfile.mkdtemp(dir=self.work_dir)
+        success, error = wait_java_compile(*start_java_compile(str(source_file), class_dir))
+        self.assertTrue(success, error)
+        return class_dir
+
+    def harness(self, source):
+        harness = JavaHarness(self.compile(source), "Main", source)
+        self.addCleanup(harness.close)
+        return harness
+
+    def test_ok_framing(self):
+        """입력을 전달하고 표준 출력을 OK 응답으로 받습니다. (테스트마다 같은 하네스 재사용)"""
+        harness = self.harness(SUM_SOURCE)
+        self.assertFalse(harness.disabled)
+        self.assertEqual(harness.run("1 2\n", 5)[:2], (True, "3"))
+        self.assertEqual(harness.run("40 2\n", 5)[:2], (True, "42"))
+
+    def test_large_output(self):
+        """응답 읽기 단위보다 큰 출력도 잘리지 않고 받습니다."""
+        harness = self.harness("""
+public class Main {
+    public static void main(String[] args) {
+        StringBuilder sb = new StringBuilder();
+        for (int i = 1; i <= 200000; i++) sb.append(i).append('\\n');
+        System.out.print(sb);
+    }
+}
+""")
+        success, output, _, _ = harness.run("", 10)
+        self.assertTrue(success)
+        lines = output.split("\n")
+        self.assertEqual((len(lines), lines[0], lines[-1]), (200000, "1", "200000"))
+
+    def test_err_framing(self):
+        """처리되지 않은 예외는 ERR 응답의 스택 트레이스로 받습니다."""
+        harness = self.harness("""
+public class Main {
+    public static void main(String[] args) {
+        throw new IllegalStateException("boom");
+    }
+}
+""")
+        success, output, _, error = harness.run("", 5)
+        self.assertFalse(success)
+        self.assertEqual(output, "")
+        self.assertIn("IllegalStateException: boom", error)
+
+    def test_system_exit(self):
+        """System.exit(0)은 정상 종료, System.exit(1)은 실행 오류로 판정합니다."""
+        harness = self.harness("""
+import java.util.Scanner;
+
+public class Main {
+    public static void main(String[] args) {
+        int status = new Scanner(System.in).nextInt();
+        System.out.println("before exit");
+        System.exit(status);
+        System.out.println("after exit");
+    }
+}
+""")
+        self.assertEqual(harness.run("0\n", 5)[:2], (True, "before exit"))
+        self.assertFalse(harness.run("1\n", 5)[0])
+        self.assertEqual(harness.run("0\n", 5)[:2], (True, "before exit"))
+
+    def test_static_state_is_reset(self):
+        """테스트마다 제출 클래스를 새로 읽어 static 필드가 초기화됩니다."""
+        harness = self.harness("""
+public class Main {
+    static int count = 0;
+
+    public static void main(String[] args) {
+        count++;
+        System.out.println(count);
+    }
+}
+""")
+        self.assertEqual(harness.run("", 5)[:2], (True, "1"))
+        self.assertEqual(harness.run("", 5)[:2], (True, "1"))
+
+    def test_timeout_respawns_harness(self):
+        """시간 초과는 별도 JVM에서 다시 확인한 뒤 시간 초과로 판정하고, 다음 테스트는 새 하네스에서 실행합니다."""
+        harness = self.harness(LOOP_SOURCE)
+        success, _, _, error = harness.run("loop\n", 1)
+        self.assertFalse(success)
+        self.assertIn("시간 초과", error)
+        self.assertIsNone(harness.process)
+
+        self.assertEqual(harness.run("stop\n", 5)[:2], (True, "done"))
+        self.assertFalse(harness.disabled)
+        self.assertIsNotNone(harness.process)
+
+    def test_lingering_thread_retries_in_new_jvm(self):
+        """main이 끝난 뒤에도 non-daemon 스레드가 남으면(RETRY) 테스트마다 JVM을 실행하는 방식으로 판정합니다."""
+        harness = self.harness("""
+public class Main {
+    public static void main(String[] args) {
+        Thread worker = new Thread(() -> {
+            while (true) {
+                Thread.onSpinWait();
+            }
+        });
+        worker.start();
+        System.out.println("42");
+        System.exit(0);
+    }
+}
+""")
+        self.assertEqual(harness.run("", 2)[:2], (True, "42"))
+        self.assertIsNone(harness.process)
+
+    def test_thread_output_is_waited_for(self):
+        """제출 코드가 만든 스레드가 제한 시간 안에 끝나면 그 출력까지 받습니다."""
+        harness = self.harness("""
+public class Main implements Runnable {
+    public static void main(String[] args) {
+        new Thread(null, new Main(), "", 1 << 26).start();
+    }
+
+    public void run() {
+        try {
+            Thread.sleep(200);
+        } catch (InterruptedException e) {
+            return;
+        }
+        System.out.println("from thread");
+    }
+}
+""")
+        self.assertEqual(harness.run("", 5)[:2], (True, "from thread"))
+        self.assertIsNotNone(harness.process)
+
+    def test_raw_stdio_uses_per_test_jvm(self):
+        """FileDescriptor.in/out으로 표준 입출력에 직접 접근하는 코드는 하네스를 쓰지 않습니다."""
+        harness = self.harness("""
+import java.io.DataInputStream;
+import java.io.FileDescriptor;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+
+public class Main {
+    public static void main(String[] args) throws IOException {
+        DataInputStream in = new DataInputStream(new FileInputStream(FileDescriptor.in));
+        FileOutputStream out = new FileOutputStream(FileDescriptor.out);
+        out.write(("read " + in.read() + "\\n").getBytes());
+        out.flush();
+    }
+}
+""")
+        self.assertTrue(harness.disabled)
+        self.assertEqual(harness.run("A", 5)[:2], (True, "read 65"))
+
+    def test_fallback_when_harness_does_not_compile(self):
+        """하네스 컴파일에 실패하면 테스트마다 JVM을 실행합니다."""
+        broken_source = Path(self.work_dir) / "TestHarness.java"
+        broken_source.write_text("public class TestHarness {", encoding="utf-8")
+        class_dir = self.compile(SUM_SOURCE)
+        with patch.object(multi_test_runner, "HARNESS_SOURCE", broken_source), \
+                patch.object(multi_test_runner, "_harness_dir", None), \
+                patch.object(multi_test_runner, "_harness_compile_failed", False):
+            harness = JavaHarness(class_dir, "Main", SUM_SOURCE)
+            self.addCleanup(harness.close)
+            self.assertTrue(harness.disabled)
+            self.assertEqual(harness.run("1 2\n", 5)[:2], (True, "3"))
+            self.assertIsNone(harness.process)
+
+
+if __name__ == "__main__":
+    unittest.main()
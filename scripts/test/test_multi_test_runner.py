@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+test_multi_test_runner.py
+multi_test_runner.py의 출력 비교, 실행 설정, 테스트케이스 중복 제거, 판정 캐시, 문제별 로그 버퍼를 테스트합니다.
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# test 디렉토리의 상위(scripts) 디렉토리 모듈을 import 할 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import multi_test_runner
+from multi_test_runner import (
+    DEFAULT_RUN_TIMEOUT,
+    MAX_RUN_TIMEOUT,
+    ProblemLogStream,
+    compare_outputs,
+    dedupe_test_cases,
+    load_cached_verdict,
+    problem_run_settings,
+    run_problem_group,
+    save_verdict,
+)
+
+
+class TestCompareOutputs(unittest.TestCase):
+    """출력 비교 테스트"""
+
+    def test_whitespace_is_ignored(self):
+        """줄 끝 공백과 마지막 빈 줄은 무시합니다."""
+        self.assertTrue(compare_outputs("1 2\n3\n", "1 2  \n3"))
+        self.assertFalse(compare_outputs("1 2\n3", "1 2\n4"))
+
+    def test_integers_are_compared_exactly(self):
+        """허용 오차가 있어도 정수 토큰은 정확히 같아야 합니다."""
+        self.assertFalse(compare_outputs("123456789", "123456790", 1e-6))
+        self.assertFalse(compare_outputs("0", "1", 1e-6))
+
+    def test_real_numbers_within_tolerance(self):
+        """실수 토큰은 절대 오차 또는 상대 오차가 허용 범위 안이면 정답입니다."""
+        self.assertTrue(compare_outputs("0.3333333", "0.3333334", 1e-6))
+        # 절대 오차는 크지만 상대 오차가 허용 범위 안인 경우
+        self.assertTrue(compare_outputs("1234567.0", "1234567.5", 1e-6))
+        self.assertTrue(compare_outputs("1e-7", "0.0", 1e-6))
+        self.assertFalse(compare_outputs("0.5", "0.6", 1e-6))
+
+    def test_real_numbers_without_tolerance(self):
+        """허용 오차가 없으면 실수도 문자열 그대로 비교합니다."""
+        self.assertFalse(compare_outputs("0.3333333", "0.3333334"))
+
+    def test_token_count_mismatch(self):
+        """토큰 개수가 다르면 오답입니다."""
+        self.assertFalse(compare_outputs("1.0 2.0", "1.0", 1e-6))
+
+    def test_non_numeric_tokens(self):
+        """숫자가 아닌 토큰이 다르면 오답입니다."""
+        self.assertFalse(compare_outputs("YES 1.0", "NO 1.0", 1e-6))
+
+
+class TestProblemRunSettings(unittest.TestCase):
+    """실행 제한 시간과 허용 오차 결정 테스트"""
+
+    def test_defaults(self):
+        """제한사항이 없으면 기본 제한 시간을 쓰고 허용 오차는 없습니다."""
+        self.assertEqual(problem_run_settings({}), (DEFAULT_RUN_TIMEOUT, None))
+
+    def test_time_limit_from_string(self):
+        """Java 시간 제한 규칙(×2+1초)을 적용합니다."""
+        timeout, _ = problem_run_settings({'limits': '시간 제한: 2 초\n메모리 제한: 256 MB'})
+        self.assertEqual(timeout, 5)
+
+    def test_time_limit_bounds(self):
+        """너무 짧거나 긴 제한 시간은 범위 안으로 맞춥니다."""
+        self.assertEqual(problem_run_settings({'limits': '시간 제한: 0.1 초'})[0], 2)
+        self.assertEqual(problem_run_settings({'limits': '시간 제한: 100 초'})[0], MAX_RUN_TIMEOUT)
+
+    def test_time_limit_from_dict(self):
+        """Gemini가 제한사항을 dict로 돌려줘도 시간 제한을 읽습니다."""
+        timeout, _ = problem_run_settings({'limits': {'시간 제한': '2 초'}})
+        self.assertEqual(timeout, 5)
+
+    def test_float_tolerance(self):
+        """오차 안내 문구에서 허용 오차를 읽습니다."""
+        details = {'output_format': '정답과의 절대/상대 오차는 10^-6까지 허용한다.'}
+        self.assertEqual(problem_run_settings(details)[1], 1e-6)
+        details = {'description': '10-9 이하의 오차를 허용한다.'}
+        self.assertEqual(problem_run_settings(details)[1], 1e-9)
+
+    def test_no_tolerance_without_error_clause(self):
+        """오차 안내가 아닌 "10 - 0" 같은 식에서는 허용 오차를 만들지 않습니다."""
+        self.assertIsNone(problem_run_settings({'description': '오차 없이 10 - 0 개를 출력한다.'})[1])
+        self.assertIsNone(problem_run_settings({'description': 'N은 10 - 3 이하이다.'})[1])
+
+
+class TestDedupeTestCases(unittest.TestCase):
+    """생성 테스트케이스 중복 제거 테스트"""
+
+    def test_removes_duplicates_and_known_cases(self):
+        """같은 케이스와 예제와 겹치는 케이스는 처음 것만 남깁니다."""
+        samples = [{'input': '1 2', 'output': '3'}]
+        generated = [
+            {'input': '1 2\n', 'output': '3\n'},
+            {'input': '2 3', 'output': '5'},
+            {'input': '2 3', 'output': '5  '},
+            {'input': '2 3', 'output': '6'},
+        ]
+        self.assertEqual(dedupe_test_cases(generated, samples), [
+            {'input': '2 3', 'output': '5'},
+            {'input': '2 3', 'output': '6'},
+        ])
+
+    def test_empty(self):
+        """빈 목록은 그대로 반환합니다."""
+        self.assertEqual(dedupe_test_cases([]), [])
+
+
+class TestVerdictCache(unittest.TestCase):
+    """판정 캐시 테스트"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp(prefix="verdict_cache_test_")
+        patcher = patch.object(multi_test_runner, 'VERDICT_CACHE_DIR', Path(self.cache_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+        os.environ.pop("BOJ_CACHE_DISABLE", None)
+        self.detail = {'test_case': 1, 'input': '1 2', 'expected': '3', 'actual': '3', 'passed': True}
+
+    def test_round_trip(self):
+        """저장한 판정을 같은 코드와 입력으로 다시 읽습니다."""
+        save_verdict("hash-a", self.detail)
+        self.assertEqual(load_cached_verdict("hash-a", '1 2', '3'), self.detail)
+
+    def test_changed_source_hash_misses(self):
+        """코드가 바뀌면(해시가 다르면) 이전 판정을 쓰지 않습니다."""
+        save_verdict("hash-a", self.detail)
+        self.assertIsNone(load_cached_verdict("hash-b", '1 2', '3'))
+
+    def test_changed_tolerance_misses(self):
+        """허용 오차가 바뀌어도 이전 판정을 쓰지 않습니다."""
+        save_verdict("hash-a", self.detail, 1e-6)
+        self.assertIsNone(load_cached_verdict("hash-a", '1 2', '3'))
+        self.assertEqual(load_cached_verdict("hash-a", '1 2', '3', 1e-6), self.detail)
+
+    def test_disabled(self):
+        """BOJ_CACHE_DISABLE이 설정되면 저장하지도 읽지도 않습니다."""
+        with patch.dict(os.environ, {"BOJ_CACHE_DISABLE": "1"}):
+            save_verdict("hash-a", self.detail)
+            self.assertIsNone(load_cached_verdict("hash-a", '1 2', '3'))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+
+class TestProblemLogBuffer(unittest.TestCase):
+    """문제별 로그 버퍼 테스트"""
+
+    def test_stdout_and_stderr_are_buffered(self):
+        """문제별 작업의 표준 출력과 표준 오류(최상위 오류의 스택 트레이스)는 그 작업의 로그에 모읍니다."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        def failing_test(problem):
+            print(f"문제 {problem['problem_id']} 테스트 중")
+            raise RuntimeError("boom")
+
+        with patch.object(sys, "stdout", ProblemLogStream(stdout)), \
+                patch.object(sys, "stderr", ProblemLogStream(stderr)), \
+                patch.object(multi_test_runner, "run_single_problem_test", side_effect=failing_test):
+            results, log = run_problem_group([{"problem_id": "1000", "author": "alice"}])
+            print("작업 밖 출력")
+
+        self.assertEqual(results[0]["result"], "ERROR")
+        self.assertIn("문제 1000 테스트 중", log)
+        self.assertIn("Traceback", log)
+        self.assertIn("RuntimeError: boom", log)
+        self.assertEqual(stdout.getvalue(), "작업 밖 출력\n")
+        self.assertEqual(stderr.getvalue(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+test_update_readme.py
+update_readme.py의 apply_updates(여러 제출을 한 번에 README에 반영)를 테스트합니다.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# test 디렉토리의 상위(scripts) 디렉토리 모듈을 import 할 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from update_readme import apply_updates
+
+# 2026-03-09(월)에 시작한 스터디의 회차 정보
+SESSION_INFO = {
+    "current_session": 1,
+    "study_start_date": "2026-03-09",
+    "start_date": "2026-03-09",
+    "last_week_start": None,
+    "last_week_end": None,
+    "created_at": "2026-03-09 00:00:00",
+    "updated_at": "2026-03-09 00:00:00",
+    "total_weeks": 0,
+}
+
+
+def table_row(readme_content, name):
+    """README 제출 현황 테이블에서 참가자의 줄을 찾습니다."""
+    for line in readme_content.split("\n"):
+        if line.startswith(f"| {name} |"):
+            return line
+    return None
+
+
+class TestApplyUpdates(unittest.TestCase):
+    """README 일괄 반영 테스트"""
+
+    def setUp(self):
+        """session_info.json이 있는 임시 디렉토리에서 실행합니다."""
+        self.original_cwd = os.getcwd()
+        self.test_dir = tempfile.mkdtemp(prefix="update_readme_test_")
+        os.chdir(self.test_dir)
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
+        self.addCleanup(os.chdir, self.original_cwd)
+        with open("session_info.json", "w", encoding="utf-8") as f:
+            json.dump(SESSION_INFO, f)
+
+    def load_session(self):
+        with open("session_info.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_new_week(self):
+        """다른 회차의 README는 새 회차 현황으로 다시 만들고, 요일별로 문제를 정렬해 넣습니다."""
+        content, failed = apply_updates("", [
+            ("1001", "alice", "2026-03-10"),
+            ("1000", "alice", "2026-03-10"),
+            ("2557", "bob", "2026-03-15"),
+        ])
+        self.assertEqual(failed, [])
+        self.assertIn("## 📅 1회차 현황", content)
+        self.assertIn("**기간**: 2026-03-09 ~ 2026-03-15", content)
+        self.assertEqual(table_row(content, "alice"), "| alice |  | 1000, 1001 |  |  |  |  |  |")
+        self.assertEqual(table_row(content, "bob"), "| bob |  |  |  |  |  |  | 2557 |")
+
+    def test_resubmission_moves_problem(self):
+        """같은 문제를 다른 날 다시 제출하면 마지막 제출 요일에만 남깁니다."""
+        content, _ = apply_updates("", [("1000", "alice", "2026-03-09")])
+        content, _ = apply_updates(content, [("1000", "alice", "2026-03-11")])
+        self.assertEqual(table_row(content, "alice"), "| alice |  |  | 1000 |  |  |  |  |")
+
+    def test_no_change(self):
+        """이미 반영된 제출만 있으면 README 내용을 그대로 반환합니다."""
+        content, _ = apply_updates("", [("1000", "alice", "2026-03-09")])
+        self.assertEqual(apply_updates(content, [("1000", "alice", "2026-03-09")]), (content, []))
+
+    def test_mixed_weeks_update_session_file(self):
+        """회차가 섞인 제출(A, B, A)은 마지막 회차로 반영하고, 회차 파일도 매번 갱신합니다."""
+        content, failed = apply_updates("", [
+            ("1000", "alice", "2026-03-10"),
+            ("1001", "alice", "2026-03-17"),
+            ("1002", "bob", "2026-03-10"),
+        ])
+        self.assertEqual(failed, [])
+        self.assertIn("## 📅 1회차 현황", content)
+        self.assertIsNone(table_row(content, "alice"))
+        self.assertEqual(table_row(content, "bob"), "| bob |  | 1002 |  |  |  |  |  |")
+        self.assertEqual(self.load_session()["current_session"], 1)
+
+    def test_invalid_date_is_reported(self):
+        """반영하지 못한 제출은 실패 목록으로 돌려줍니다."""
+        content, failed = apply_updates("", [
+            ("1000", "alice", "2026-03-10"),
+            ("1001", "alice", "2026-13-01"),
+        ])
+        self.assertEqual(failed, [("1001", "alice", "2026-13-01")])
+        self.assertEqual(table_row(content, "alice"), "| alice |  | 1000 |  |  |  |  |  |")
+
+
+if __name__ == "__main__":
+    unittest.main()
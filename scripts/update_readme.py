@@ -1,6 +1,6 @@
 import argparse
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 import sys
 import os
@@ -8,58 +8,17 @@ import os
 # session_counter 모듈 import를 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-
-def load_readme():
-    """기존 README.md 로드 또는 초기 템플릿 생성"""
-    readme_path = Path("README.md")
-    if readme_path.exists():
-        with open(readme_path, "r", encoding="utf-8") as f:
-            return f.read()
-    return create_initial_readme()
-
-
-def get_week_info(submission_date=None):
-    """현재 회차 정보 계산"""
-    try:
-        from session_counter import get_session_info
-
-        return get_session_info(submission_date)
-    except ImportError:
-        print("⚠️ session_counter 모듈을 찾을 수 없어 기본값을 사용합니다.")
-        today = datetime.now()
-        start_of_week = today - timedelta(days=today.weekday())
-        end_of_week = start_of_week + timedelta(days=6)
-        return {
-            "session_number": 1,
-            "monday": start_of_week.strftime("%Y-%m-%d"),
-            "sunday": end_of_week.strftime("%Y-%m-%d"),
-            "deadline": end_of_week.strftime("%Y-%m-%d 23:59"),
-        }
-
-
-def create_initial_readme():
-    """초기 README.md 템플릿 생성"""
-    week_info = get_week_info()
-    table = create_participant_table({}, week_info)  # 빈 참가자 목록으로 테이블 생성
-    static_info = create_static_info_section()
-
-    readme_content = f"""# 🚀 알고리즘 스터디
-
-## 📅 {week_info['session_number']}회차 현황
-**기간**: {week_info['monday']} ~ {week_info['sunday']}
-**마감**: {week_info['deadline']}
-
-### 제출 현황
-
-{table}
-{static_info}
-"""
-    return update_footer(readme_content)
-
-
-def create_static_info_section():
-    """정적 정보 섹션 생성"""
-    return """
+# README의 회차 제목 (예: "## 📅 3회차 현황")
+WEEK_HEADER_PATTERN = re.compile(r"## 📅 (\d+)회차 현황")
+# README 맨 끝의 자동 업데이트 푸터
+FOOTER_MARKER = "*Auto-updated by GitHub Actions 🤖"
+FOOTER_PATTERN = re.compile(r"\n---\n\*Auto-updated by GitHub Actions 🤖.*", re.DOTALL)
+README_FOOTER = "\n\n---\n*Auto-updated by GitHub Actions 🤖 (PR 브랜치에서 main 브랜치 데이터 반영)*"
+# 테이블 열 순서와 같은 요일 이름 (월=0, 일=6)
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+# README 하단의 자동화 시스템 소개 (회차와 관계없이 항상 같은 내용)
+STATIC_INFO_SECTION = """
 ## 🤖 자동화 시스템 소개
 
 ### 🔧 주요 기능
@@ -91,6 +50,8 @@ GEMINI_API_KEY=your_gemini_api_key
 본인깃허브아이디_MATTERMOST_URL=your_personal_webhook  # 개인 DM용 (필수)
 ```
 
+마감 알림(deadline-checker)은 `MATTERMOST_WEBHOOKS_JSON` Secret에 `{"githubID": "webhook URL", ...}` 형식으로 참가자 전체의 webhook을 한 번에 설정할 수도 있습니다. (개별 `_MATTERMOST_URL`보다 우선)
+
 **📱 개인 알림 설정**: 주간 5문제 미달 시 개인 DM 알림을 받으려면 반드시 개인 webhook URL을 설정하세요. 
 
 #### 3. 디렉토리 구조
@@ -130,21 +91,101 @@ GEMINI_API_KEY=your_gemini_api_key
 """
 
 
+def load_readme():
+    """기존 README.md 로드 또는 초기 템플릿 생성"""
+    readme_path = Path("README.md")
+    if readme_path.exists():
+        with open(readme_path, "r", encoding="utf-8") as f:
+            return f.read()
+    return create_initial_readme()
+
+
+def get_week_info(submission_date=None):
+    """현재 회차 정보 계산"""
+    try:
+        from session_counter import get_session_info
+
+        return get_session_info(submission_date)
+    except ImportError:
+        print("⚠️ session_counter 모듈을 찾을 수 없어 기본값을 사용합니다.")
+        today = datetime.now()
+        start_of_week = today - timedelta(days=today.weekday())
+        end_of_week = start_of_week + timedelta(days=6)
+        return {
+            "session_number": 1,
+            "monday": start_of_week.strftime("%Y-%m-%d"),
+            "sunday": end_of_week.strftime("%Y-%m-%d"),
+            "deadline": end_of_week.strftime("%Y-%m-%d 23:59"),
+        }
+
+
+def create_initial_readme():
+    """초기 README.md 템플릿 생성"""
+    week_info = get_week_info()
+    table = create_participant_table({}, week_info)  # 빈 참가자 목록으로 테이블 생성
+    return update_footer(render_readme(table, week_info))
+
+
+def render_readme(table, week_info):
+    """회차 정보와 제출 현황 테이블로 README 본문 생성 (푸터 제외)"""
+    return f"""# 🚀 알고리즘 스터디
+
+## 📅 {week_info['session_number']}회차 현황
+**기간**: {week_info['monday']} ~ {week_info['sunday']}
+**마감**: {week_info['deadline']}
+
+### 제출 현황
+
+{table}
+{create_static_info_section()}
+"""
+
+
+def create_static_info_section():
+    """정적 정보 섹션 생성"""
+    return STATIC_INFO_SECTION
+
+
+def is_current_week_readme(readme_content, week_info):
+    """README가 주어진 회차의 현황을 담고 있는지 확인"""
+    match = WEEK_HEADER_PATTERN.search(readme_content)
+    return bool(match) and int(match.group(1)) == week_info["session_number"]
+
+
+def find_submission_table(lines):
+    """README 줄 목록에서 제출 현황 테이블의 (시작, 끝) 줄 번호를 찾습니다. 테이블이 없으면 None"""
+    try:
+        start = lines.index("### 제출 현황") + 1
+    except ValueError:
+        return None
+
+    # 제목 다음의 빈 줄을 건너뛰고, "|"로 시작하는 줄이 이어지는 동안을 테이블로 봅니다.
+    while start < len(lines) and not lines[start].strip():
+        start += 1
+    end = start
+    while end < len(lines) and lines[end].startswith("|"):
+        end += 1
+    return start, end
+
+
+def parse_problem_cell(cell):
+    """테이블 칸 문자열에서 문제 번호 집합 추출 (format_problem_cell의 역변환)"""
+    return {token for token in map(str.strip, cell.removesuffix("...").split(",")) if token.isdigit()}
+
+
 def parse_current_week_stats(readme_content, current_week_info):
     """README에서 현재 주차의 제출 현황을 파싱"""
     stats = {"participants": {}}
-    week_pattern = rf"## 📅 {current_week_info['session_number']}회차 현황"
-    if not re.search(week_pattern, readme_content):
+    if not is_current_week_readme(readme_content, current_week_info):
         return {"participants": {}, "need_reset": True}
 
-    table_content_match = re.search(
-        r"### 제출 현황\n\n(.*?)(\n##|$)", readme_content, re.DOTALL
-    )
-    if not table_content_match:
+    lines = readme_content.split("\n")
+    table_bounds = find_submission_table(lines)
+    if not table_bounds:
         return stats
 
-    table_content = table_content_match.group(1)
-    lines = table_content.strip().split("\n")
+    start, end = table_bounds
+    lines = lines[start:end]
 
     for line in lines:
         if (
@@ -156,87 +197,55 @@ def parse_current_week_stats(readme_content, current_week_info):
             parts = [p.strip() for p in line.split("|")[1:-1]]
             if len(parts) >= 8 and parts[0]:
                 participant = parts[0]
-                weekdays = [
-                    "monday",
-                    "tuesday",
-                    "wednesday",
-                    "thursday",
-                    "friday",
-                    "saturday",
-                    "sunday",
-                ]
-                participant_data = {day: [] for day in weekdays}
-                for i, day in enumerate(weekdays):
+                participant_data = {day: set() for day in WEEKDAYS}
+                for i, day in enumerate(WEEKDAYS):
                     if i + 1 < len(parts) and parts[i + 1]:
-                        problems = [
-                            p.strip()
-                            for p in parts[i + 1].replace("...", "").split(",")
-                            if p.strip().isdigit()
-                        ]
-                        participant_data[day] = problems
+                        participant_data[day] = parse_problem_cell(parts[i + 1])
                 stats["participants"][participant] = participant_data
     return stats
 
 
 def get_weekday_from_date(date_str):
     """날짜 문자열에서 요일 인덱스 반환 (월=0, 일=6)"""
-    return datetime.strptime(date_str, "%Y-%m-%d").weekday()
+    return date.fromisoformat(date_str).weekday()
+
+
+def format_problem_cell(problems):
+    """한 요일의 문제 목록을 테이블 칸 문자열로 변환 (3개 초과 시 생략)"""
+    problems = sorted(problems, key=int)
+    if len(problems) > 3:
+        return ", ".join(problems[:3]) + "..."
+    return ", ".join(problems)
 
 
 def create_participant_table(participants, week_info):
     """참가자 현황 테이블 마크다운 생성"""
-    monday = datetime.strptime(week_info["monday"], "%Y-%m-%d")
+    monday = date.fromisoformat(week_info["monday"])
     week_dates = [(monday + timedelta(days=i)).strftime("%m/%d") for i in range(7)]
 
-    header = f"""| 참가자 | 월 | 화 | 수 | 목 | 금 | 토 | 일 |
-|--------|----|----|----|----|----|----|---|
-|        | {week_dates[0]} | {week_dates[1]} | {week_dates[2]} | {week_dates[3]} | {week_dates[4]} | {week_dates[5]} | {week_dates[6]} |"""
-
-    rows = []
+    # 모든 줄을 한 리스트에 모은 뒤 마지막에 한 번만 합칩니다.
+    lines = [
+        "| 참가자 | 월 | 화 | 수 | 목 | 금 | 토 | 일 |",
+        "|--------|----|----|----|----|----|----|---|",
+        f"|        | {' | '.join(week_dates)} |",
+    ]
     if not participants:
-        rows.append("| 아직_제출없음 |  |  |  |  |  |  |  |")
+        lines.append("| 아직_제출없음 |  |  |  |  |  |  |  |")
     else:
-        weekdays = [
-            "monday",
-            "tuesday",
-            "wednesday",
-            "thursday",
-            "friday",
-            "saturday",
-            "sunday",
-        ]
         for name in sorted(participants.keys()):
             data = participants[name]
-            row_parts = [name]
-            for day in weekdays:
-                problems = sorted(data.get(day, []), key=int)
-                if not problems:
-                    row_parts.append("")
-                elif len(problems) > 3:
-                    row_parts.append(", ".join(problems[:3]) + "...")
-                else:
-                    row_parts.append(", ".join(problems))
-            rows.append("| " + " | ".join(row_parts) + " |")
+            cells = " | ".join(format_problem_cell(data.get(day, ())) for day in WEEKDAYS)
+            lines.append(f"| {name} | {cells} |")
 
-    return header + "\n" + "\n".join(rows)
+    return "\n".join(lines)
 
 
 def remove_problem_from_all_days(participant_data, problem_id):
     """참가자의 모든 요일에서 특정 문제를 제거합니다."""
-    weekdays = [
-        "monday",
-        "tuesday", 
-        "wednesday",
-        "thursday",
-        "friday",
-        "saturday",
-        "sunday",
-    ]
-    
     removed_from_days = []
-    for day in weekdays:
+    for day in WEEKDAYS:
         if problem_id in participant_data[day]:
-            participant_data[day].remove(problem_id)
+            participant_data[day].discard(problem_id)
             removed_from_days.append(day)
     
     return removed_from_days
@@ -244,17 +253,92 @@ def remove_problem_from_all_days(participant_data, problem_id):
 
 def update_footer(readme_content):
     """기존 푸터를 제거하고 새로운 푸터를 추가합니다."""
+    # 이미 맨 끝에 같은 푸터가 하나만 있으면 정규식 치환 없이 그대로 반환
+    body = readme_content[: -len(README_FOOTER)]
+    if readme_content.endswith(README_FOOTER) and body == body.rstrip() and FOOTER_MARKER not in body:
+        return readme_content
+
     # 기존 푸터 제거 (정규식 사용)
-    cleaned_content = re.sub(
-        r"\n---\n\*Auto-updated by GitHub Actions 🤖.*",
-        "",
-        readme_content,
-        flags=re.DOTALL,
-    )
+    cleaned_content = FOOTER_PATTERN.sub("", readme_content)
 
     # 새로운 푸터 추가
-    new_footer = "\n\n---\n*Auto-updated by GitHub Actions 🤖 (PR 브랜치에서 main 브랜치 데이터 반영)*"
-    return cleaned_content.rstrip() + new_footer
+    return cleaned_content.rstrip() + README_FOOTER
+
+
+def apply_submission(participants, problem_id, author, submission_date):
+    """참가자 현황에 제출 하나를 반영합니다. 바뀐 내용이 있으면 True를 반환합니다."""
+    weekday_name = WEEKDAYS[get_weekday_from_date(submission_date)]
+    participant_data = participants.setdefault(author, {day: set() for day in WEEKDAYS})
+
+    # 이미 같은 요일에만 기록된 문제라면 현황은 바뀌지 않습니다.
+    if [day for day, problems in participant_data.items() if problem_id in problems] == [weekday_name]:
+        print(f"  ℹ️ 문제 {problem_id}가 이미 {weekday_name}에 존재함")
+        return False
+
+    # 중복 제거: 기존의 모든 날짜에서 이 문제를 제거
+    removed_from_days = remove_problem_from_all_days(participant_data, problem_id)
+    if removed_from_days:
+        print(f"  🔄 문제 {problem_id} 기존 제출 제거됨: {', '.join(removed_from_days)}")
+
+    # 새로운 날짜에 문제 추가
+    participant_data[weekday_name].add(problem_id)
+    print(f"  ✅ 문제 {problem_id}를 {weekday_name}에 추가")
+    return True
+
+
+def render_update(readme_content, participants, week_info, reset=False):
+    """참가자 현황을 반영한 README 내용 생성 (다른 회차의 README거나 reset이면 전체 재생성)"""
+    # 새 테이블 생성
+    new_table = create_participant_table(participants, week_info)
+
+    # README 내용에서 테이블 부분만 교체
+    # 주차 정보가 다르면 전체 README 재생성
+    if reset or not is_current_week_readme(readme_content, week_info):
+        print(f"  🔄 새로운 주차({week_info['session_number']})로 README 전체 재생성")
+        new_readme = render_readme(new_table, week_info)
+    else:
+        # 기존 주차의 테이블만 업데이트
+        lines = readme_content.split("\n")
+        table_bounds = find_submission_table(lines)
+        if table_bounds:
+            start, end = table_bounds
+            lines[start:end] = [new_table]
+        new_readme = "\n".join(lines)
+
+    # 푸터 업데이트
+    return update_footer(new_readme)
+
+
+def apply_updates(readme_content, submissions):
+    """README 내용에 (문제 번호, 제출자, 제출 날짜) 목록을 반영합니다. (파일은 쓰지 않음)
+
+    README는 처음 한 번만 파싱하고, 제출은 참가자 현황에만 반영한 뒤 마지막에 한 번만 테이블을 만듭니다.
+    (새 README 내용, 반영에 실패한 제출 목록)을 반환합니다.
+    """
+    week_info = None
+    participants = {}
+    changed = reset = False
+    failed = []
+
+    for problem_id, author, submission_date in submissions:
+        print(f"\n🔄 처리 중: 문제 {problem_id} ({author}) - {submission_date}")
+        try:
+            submission_week = get_week_info(submission_date)
+            if week_info is None:
+                participants = parse_current_week_stats(readme_content, submission_week)["participants"]
+            elif submission_week["session_number"] != week_info["session_number"]:
+                # 다른 회차의 제출이 섞여 있으면 그 회차의 빈 현황에서 다시 시작합니다.
+                participants = {}
+                changed = reset = True
+            week_info = submission_week
+            changed = apply_submission(participants, problem_id, author, submission_date) or changed
+        except Exception as e:
+            print(f"  ⚠️ 예외: 문제 {problem_id} README 반영 중 예외 발생: {e}")
+            failed.append((problem_id, author, submission_date))
+
+    if not changed:
+        return readme_content, failed
+    return render_update(readme_content, participants, week_info, reset), failed
 
 
 def main():
@@ -275,84 +359,12 @@ def main():
         sys.exit(1)
 
     readme_content = load_readme()
-    current_week = get_week_info(args.submission_date)
-
-    # 현재 README 파싱
-    stats = parse_current_week_stats(readme_content, current_week)
-    participants = stats.get("participants", {})
-
-    # 새 제출 정보 추가/업데이트
-    weekday_name = [
-        "monday",
-        "tuesday",
-        "wednesday",
-        "thursday",
-        "friday",
-        "saturday",
-        "sunday",
-    ][get_weekday_from_date(args.submission_date)]
-    
-    participant_data = participants.get(
-        args.author,
-        {
-            day: []
-            for day in [
-                "monday",
-                "tuesday",
-                "wednesday",
-                "thursday",
-                "friday",
-                "saturday",
-                "sunday",
-            ]
-        },
-    )
-
-    # 중복 제거: 기존의 모든 날짜에서 이 문제를 제거
-    removed_from_days = remove_problem_from_all_days(participant_data, args.problem_id)
-    if removed_from_days:
-        print(f"  🔄 문제 {args.problem_id} 기존 제출 제거됨: {', '.join(removed_from_days)}")
-
-    # 새로운 날짜에 문제 추가
-    if args.problem_id not in participant_data[weekday_name]:
-        participant_data[weekday_name].append(args.problem_id)
-        print(f"  ✅ 문제 {args.problem_id}를 {weekday_name}에 추가")
-    else:
-        print(f"  ℹ️ 문제 {args.problem_id}가 이미 {weekday_name}에 존재함")
-
-    participants[args.author] = participant_data
-
-    # 새 테이블 생성
-    new_table = create_participant_table(participants, current_week)
-
-    # README 내용에서 테이블 부분만 교체
-    # 주차 정보가 다르면 전체 README 재생성
-    week_pattern = rf"## 📅 {current_week['session_number']}회차 현황"
-    if not re.search(week_pattern, readme_content):
-        print(f"  🔄 새로운 주차({current_week['session_number']})로 README 전체 재생성")
-        static_info = create_static_info_section()
-        new_readme = f"""# 🚀 알고리즘 스터디
-
-## 📅 {current_week['session_number']}회차 현황
-**기간**: {current_week['monday']} ~ {current_week['sunday']}
-**마감**: {current_week['deadline']}
-
-### 제출 현황
-
-{new_table}
-{static_info}
-"""
-    else:
-        # 기존 주차의 테이블만 업데이트
-        new_readme = re.sub(
-            r"(### 제출 현황\n\n)(.*?)(\n##|$)",
-            f"\\1{new_table}\\3",
-            readme_content,
-            flags=re.DOTALL,
-        )
-
-    # 푸터 업데이트
-    new_readme = update_footer(new_readme)
+    new_readme, failed = apply_updates(readme_content, [(args.problem_id, args.author, args.submission_date)])
+    if failed:
+        sys.exit(1)
+    if new_readme == readme_content and Path("README.md").exists():
+        print(f"ℹ️ README.md 변경 사항 없음: {args.author} - 문제 {args.problem_id} ({args.submission_date})")
+        return
 
     # README 파일 저장
     try:
@@ -5,9 +5,11 @@ scripts/update_readme_batch.py
 """
 
 import json
-import subprocess
 import sys
 from datetime import datetime
+from pathlib import Path
+
+from update_readme import apply_updates, load_readme
 
 
 def main():
@@ -21,10 +23,13 @@ def main():
 
         print(f"✅ README 업데이트 대상: {len(all_problems_in_pr)}개 문제")
 
+        # 제출 날짜가 없는 문제의 기본값 (실행 도중 자정이 지나도 모든 문제가 같은 날짜를 쓰도록 한 번만 구함)
+        today = datetime.now().strftime("%Y-%m-%d")
+
         # 날짜별로 문제들 그룹화하여 로깅
         date_groups = {}
         for problem in all_problems_in_pr:
-            submission_date = problem.get("submission_date", datetime.now().strftime("%Y-%m-%d"))
+            submission_date = problem.get("submission_date", today)
             if submission_date not in date_groups:
                 date_groups[submission_date] = []
             date_groups[submission_date].append(problem)
@@ -34,61 +39,31 @@ def main():
             problem_ids = [p["problem_id"] for p in problems]
             print(f"  - {date}: {len(problems)}개 문제 ({', '.join(problem_ids)})")
 
-        # 각 문제별로 README 업데이트 실행
-        success_count = 0
-        failure_count = 0
-
-        for problem in all_problems_in_pr:
-            problem_id = problem["problem_id"]
-            author = problem["author"]
-            submission_date = problem.get("submission_date", datetime.now().strftime("%Y-%m-%d"))
-            language = problem.get("language", "Java")
-
-            print(f"\n🔄 처리 중: 문제 {problem_id} ({author}) - {submission_date}")
-
-            cmd = [
-                "python",
-                "scripts/update_readme.py",
-                "--problem-id",
-                problem_id,
-                "--author",
-                author,
-                "--submission-date",
-                submission_date,
-                "--language",
-                language,
-            ]
-
+        # README를 한 번만 읽고, 모든 문제를 메모리에서 반영한 뒤 한 번만 저장합니다.
+        original_readme = load_readme()
+        submissions = [
+            (
+                problem["problem_id"],
+                problem["author"],
+                problem.get("submission_date", today),
+            )
+            for problem in all_problems_in_pr
+        ]
+        readme_content, failed = apply_updates(original_readme, submissions)
+        failure_count = len(failed)
+        success_count = len(submissions) - failure_count
+
+        if readme_content == original_readme and Path("README.md").exists():
+            print(f"\nℹ️ README.md 변경 사항이 없어 저장을 건너뜁니다.")
+        elif success_count:
             try:
-                result = subprocess.run(
-                    cmd, 
-                    check=True, 
-                    timeout=30,
-                    capture_output=True,
-                    text=True
-                )
-                
-                print(f"  ✅ 성공: 문제 {problem_id} README 업데이트 완료")
-                if result.stdout:
-                    print(f"     출력: {result.stdout.strip()}")
-                success_count += 1
-                
-            except subprocess.CalledProcessError as e:
-                print(f"  ❌ 실패: 문제 {problem_id} README 업데이트 실패")
-                print(f"     오류 코드: {e.returncode}")
-                if e.stdout:
-                    print(f"     출력: {e.stdout.strip()}")
-                if e.stderr:
-                    print(f"     에러: {e.stderr.strip()}")
-                failure_count += 1
-                
-            except subprocess.TimeoutExpired:
-                print(f"  ⏰ 시간초과: 문제 {problem_id} README 업데이트 시간초과")
-                failure_count += 1
-                
-            except Exception as e:
-                print(f"  ⚠️ 예외: 문제 {problem_id} README 업데이트 중 예외 발생: {e}")
-                failure_count += 1
+                with open("README.md", "w", encoding="utf-8") as f:
+                    f.write(readme_content)
+                print(f"\n💾 README.md 저장 완료")
+            except OSError as e:
+                print(f"\n❌ README.md 저장 실패: {e}")
+                failure_count += success_count
+                success_count = 0
 
         # 최종 요약
         print(f"\n📊 README 업데이트 완료")
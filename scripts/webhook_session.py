@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+scripts/webhook_session.py
+Mattermost 웹훅 전송 스크립트들이 함께 쓰는 세션과 제한 시간 설정입니다.
+(backoff_max, backoff_jitter를 사용하므로 urllib3 2.x 이상이 필요합니다.)
+"""
+
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 웹훅 요청 제한 시간(초): (연결, 응답)
+WEBHOOK_TIMEOUT = (3.05, 5)
+# 첫 요청이 실패한 뒤 재시도에 쓸 수 있는 시간(초). 첫 요청(최대 약 8초)과 합쳐
+# 느린 웹훅 하나가 작업을 오래 붙잡지 않도록 재시도 포함 약 20초 안에 끝나게 합니다.
+WEBHOOK_RETRY_BUDGET = 12
+
+
+class DeadlineRetry(Retry):
+    """첫 실패 후 WEBHOOK_RETRY_BUDGET초 안에 끝나지 않을 재시도는 보내지 않는 Retry입니다.
+
+    백오프를 기다린 뒤 다음 요청이 제한 시간을 모두 쓰더라도 기한 안에 끝날 때만 재시도하고,
+    그렇지 않으면 재시도 횟수를 모두 쓴 것과 같이 처리합니다.
+    """
+    deadline = None
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.deadline = self.deadline
+        return retry
+
+    def increment(self, *args, **kwargs):
+        retry = self
+        if retry.deadline is None:
+            # 세션이 공유하는 원래 객체는 그대로 두고, 요청마다 기한을 가진 사본을 만듭니다.
+            retry = self.new()
+            retry.deadline = time.monotonic() + WEBHOOK_RETRY_BUDGET
+
+        next_retry = Retry.increment(retry, *args, **kwargs)
+        if time.monotonic() + next_retry.get_backoff_time() + sum(WEBHOOK_TIMEOUT) > retry.deadline:
+            return Retry.increment(retry.new(total=0), *args, **kwargs)
+        return next_retry
+
+
+def create_webhook_session(pool_maxsize=10):
+    """웹훅 전송에 재사용할 세션을 만듭니다.
+
+    알림마다 새 연결(DNS, TCP, TLS)을 맺지 않도록 pool_maxsize개까지 같은 호스트로의 연결을 유지하고,
+    일시적인 오류(429/5xx, 연결 실패)는 지수 백오프와 지터를 두고 재시도합니다.
+    (동시에 실패한 요청들이 한꺼번에 재시도하지 않도록)
+    응답 대기 중 시간 초과는 서버가 이미 요청을 받았을 수 있으므로, 알림이 두 번 가지 않도록 재시도하지 않습니다.
+    서버가 보낸 Retry-After 값은 따르지 않아, 긴 대기 시간을 받아도 재시도 기한을 넘기지 않습니다.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=DeadlineRetry(
+            total=4,
+            read=0,
+            backoff_factor=0.5,
+            backoff_max=2,
+            backoff_jitter=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"],
+            respect_retry_after_header=False,
+        ),
+    ))
+    return session